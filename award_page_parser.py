@@ -0,0 +1,129 @@
+# Browserless parsing of basketball-reference award pages with lxml
+import threading
+
+import pandas as pd
+from lxml import html
+
+
+# Award label -> table id on awards_YYYY.html
+AWARD_TABLES = {
+    'MVP': 'mvp',
+    'ROY': 'roy',
+    'DPOY': 'dpoy',
+    'SMOY': 'smoy',
+    'MIP': 'mip',
+    'CLUTCH_POY': 'clutch_poy',
+}
+
+# basketball-reference serves UTF-8; without this lxml guesses latin-1 for raw bytes.
+# lxml parsers must not be shared between threads, so each scrape worker gets its own
+_parsers = threading.local()
+
+
+def _utf8_parser():
+    parser = getattr(_parsers, 'utf8', None)
+    if parser is None:
+        parser = _parsers.utf8 = html.HTMLParser(encoding='utf-8')
+    return parser
+
+
+def _collect_tables(tree, table_ids):
+    # One pass over the live DOM and one over the comments, however many tables are wanted
+    wanted = set(table_ids)
+    found = {}
+    for table in tree.xpath('//table[@id]'):
+        if table.get('id') in wanted:
+            found.setdefault(table.get('id'), table)
+
+    missing = wanted - set(found)
+    if missing:
+        # basketball-reference ships many tables inside HTML comments and unhides them with JS
+        for comment in tree.xpath('//comment()'):
+            text = comment.text or ''
+            if not any(f'id="{table_id}"' in text for table_id in missing):
+                continue
+            fragment = html.fromstring(f"<div>{text}</div>".encode('utf-8'), parser=_utf8_parser())
+            for table in fragment.xpath('//table[@id]'):
+                if table.get('id') in missing:
+                    found.setdefault(table.get('id'), table)
+            missing = wanted - set(found)
+            if not missing:
+                break
+    return found
+
+
+def _find_table(tree, table_id):
+    return _collect_tables(tree, [table_id]).get(table_id)
+
+
+def _cell_text(row, data_stat):
+    cells = row.xpath(f'.//td[@data-stat="{data_stat}"]')
+    if not cells:
+        return None
+    # Collapse whitespace the way WebElement.text renders it
+    return ' '.join(cells[0].text_content().split())
+
+
+def parse_voting_rows(table, min_points=100):
+    # Yields (player, points) for every voting row above the threshold
+    for row in table.xpath('./tbody/tr'):
+        if 'thead' in (row.get('class') or ''):
+            continue
+
+        player_name = _cell_text(row, 'player')
+        points_text = _cell_text(row, 'points_won')
+        if player_name is None or points_text is None:
+            continue
+
+        try:
+            points = float(points_text) if points_text else 0
+        except ValueError:
+            points = 0
+
+        if points > min_points and player_name:
+            yield player_name, points
+
+
+def parse_document(page):
+    if isinstance(page, str):
+        page = page.encode('utf-8')
+    if isinstance(page, bytes):
+        return html.fromstring(page, parser=_utf8_parser())
+    return page
+
+
+def parse_mvp_table(page, year, min_points=100):
+    # Same columns and row order as MVPSeleniumScraper.get_mvp_voting
+    table = _find_table(parse_document(page), AWARD_TABLES['MVP'])
+    if table is None:
+        return None
+
+    data = [{
+        'Player': player_name,
+        'Points': points,
+        'Season': f"{year-1}-{str(year)[-2:]}",
+        'Year': year
+    } for player_name, points in parse_voting_rows(table, min_points)]
+    return pd.DataFrame(data)
+
+
+def parse_award_tables(page, year, awards=None, min_points=100):
+    # Long format (Award, Season, Year, Player, Points) for every voting table on one page
+    awards = list(awards or AWARD_TABLES)
+    tables = _collect_tables(parse_document(page), [AWARD_TABLES[award] for award in awards])
+    season = f"{year-1}-{str(year)[-2:]}"
+
+    data = []
+    for award in awards:
+        table = tables.get(AWARD_TABLES[award])
+        if table is None:
+            continue
+        for player_name, points in parse_voting_rows(table, min_points):
+            data.append({
+                'Award': award,
+                'Season': season,
+                'Year': year,
+                'Player': player_name,
+                'Points': points
+            })
+    return pd.DataFrame(data, columns=['Award', 'Season', 'Year', 'Player', 'Points'])
@@ -0,0 +1,125 @@
+# Leave-one-season-out backtests over an alpha grid, fanned out across a process pool
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from mvp_features import derive_season_features
+from mvp_predictor import FEATURES, TARGET, feature_matrix, fit_ridge, fold_metrics, predict_ridge
+from mvp_storage import read_complete_stats
+
+
+DEFAULT_ALPHAS = [0.1, 0.3, 1.0, 3.0, 10.0, 30.0, 100.0]
+
+# Arrays shared with the workers, opened read-only from .npy files (memory-mapped)
+SHARED_ARRAYS = ('X', 'y', 'season_codes', 'winners')
+_shared = {}
+
+
+def write_shared_arrays(directory, arrays):
+    for name in SHARED_ARRAYS:
+        np.save(os.path.join(directory, f"{name}.npy"), arrays[name])
+
+
+def open_shared_arrays(directory):
+    # Each worker maps the same pages instead of receiving a pickled copy per task
+    _shared.clear()
+    _shared.update({name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+                    for name in SHARED_ARRAYS})
+
+
+def run_fold(task):
+    season_code, alpha = task
+    X, y = _shared['X'], _shared['y']
+    held_out = np.asarray(_shared['season_codes']) == season_code
+    params = fit_ridge(X[~held_out], y[~held_out], alpha)
+    metrics = fold_metrics(predict_ridge(params, X[held_out]), y[held_out], _shared['winners'][held_out])
+    # Row in the full frame, so the parent can name the predicted player
+    metrics['predicted_index'] = int(np.flatnonzero(held_out)[metrics['predicted_index']])
+    return {'season_code': season_code, 'ALPHA': alpha, **metrics}
+
+
+def backtest(df, alphas=None, features=None, workers=None):
+    # One task per (held-out season, alpha); returns a row per task
+    alphas = list(alphas or DEFAULT_ALPHAS)
+    features = list(features or FEATURES)
+    df = derive_season_features(df).reset_index(drop=True)
+    season_codes, seasons = pd.factorize(df['Season'], sort=True)
+    arrays = {
+        'X': feature_matrix(df, features),
+        'y': df[TARGET].to_numpy(dtype=float),
+        'season_codes': season_codes.astype(np.int32),
+        'winners': df['MVP_WINNER'].to_numpy(dtype=bool),
+    }
+    tasks = [(code, alpha) for alpha in alphas for code in range(len(seasons))]
+    workers = workers or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory(prefix='mvp_backtest_') as directory:
+        write_shared_arrays(directory, arrays)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=open_shared_arrays,
+                                     initargs=(directory,)) as pool:
+                results = list(pool.map(run_fold, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+        else:
+            open_shared_arrays(directory)
+            results = [run_fold(task) for task in tasks]
+            _shared.clear()
+
+    results = pd.DataFrame(results)
+    results.insert(0, 'Season', seasons[results.pop('season_code')])
+    results['Predicted'] = df['Player'].to_numpy()[results.pop('predicted_index')]
+    winners = df[df['MVP_WINNER']].groupby('Season')['Player'].agg(', '.join)
+    results['Winner'] = results['Season'].map(winners)
+    return results
+
+
+def summarize(results):
+    # Per-alpha accuracy, best first (top-1, then top-3, then lower share error)
+    summary = results.groupby('ALPHA').agg(TOP1=('TOP1_HIT', 'mean'), TOP3=('TOP3_HIT', 'mean'),
+                                           SHARE_MAE=('SHARE_MAE', 'mean'))
+    summary = summary.assign(NEG_MAE=-summary['SHARE_MAE'])
+    summary = summary.sort_values(['TOP1', 'TOP3', 'NEG_MAE'], ascending=False).drop(columns='NEG_MAE')
+    return summary
+
+
+def main(argv=None, prog=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=prog, description="Leave-one-season-out backtest of the MVP model")
+    parser.add_argument('--data', default='mvp_complete_stats.csv', help="training data (.csv or Parquet dataset)")
+    parser.add_argument('--alphas', default=','.join(f"{alpha:g}" for alpha in DEFAULT_ALPHAS),
+                        help="comma-separated ridge penalties to grid over")
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: all CPUs)")
+    parser.add_argument('--output', help="write every fold's result to this CSV")
+    args = parser.parse_args(argv)
+
+    df = read_complete_stats(args.data)
+    alphas = [float(alpha) for alpha in args.alphas.split(',')]
+
+    start = time.perf_counter()
+    results = backtest(df, alphas, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"{len(results)} folds ({results['Season'].nunique()} seasons x {len(alphas)} alphas) in {elapsed:.2f}s\n")
+
+    summary = summarize(results)
+    print(f"{'Alpha':>8} | {'Top-1':>6} | {'Top-3':>6} | {'Share MAE':>9}")
+    print("-" * 40)
+    for alpha, row in summary.iterrows():
+        print(f"{alpha:>8g} | {row['TOP1']*100:5.1f}% | {row['TOP3']*100:5.1f}% | {row['SHARE_MAE']:9.3f}")
+
+    best = summary.index[0]
+    print(f"\nPer-season results at alpha={best:g}:")
+    for _, row in results[results['ALPHA'] == best].iterrows():
+        marker = 'top-1' if row['TOP1_HIT'] else ('top-3' if row['TOP3_HIT'] else 'miss')
+        print(f"  {row['Season']}  {marker:<5}  predicted {row['Predicted']:<26} actual {row['Winner']}")
+
+    if args.output:
+        results.to_csv(args.output, index=False)
+        print(f"\nSaved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
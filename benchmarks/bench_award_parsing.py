@@ -0,0 +1,62 @@
+# Benchmark: Selenium WebElement walk vs one-pass lxml parsing of saved award pages
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from fixtures import write_award_pages
+from mvp_scraper import MVPSeleniumScraper
+
+
+def scrape(engine, base_url, years, driver=None):
+    scraper = MVPSeleniumScraper(min(years), max(years), headless=True, base_url=base_url, engine=engine)
+    scraper.driver = driver
+    frames = []
+    start = time.perf_counter()
+    for year in years:
+        frames.append(scraper.get_mvp_voting(year))
+    elapsed = time.perf_counter() - start
+    return elapsed, pd.concat(frames, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fixtures', help="directory with awards/awards_YYYY.html (default: synthetic pages)")
+    parser.add_argument('--selenium', action='store_true', help="also time the Selenium engine (needs Chrome)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixtures = args.fixtures
+        if fixtures is None:
+            fixtures = tmp
+            write_award_pages(fixtures, os.path.join(ROOT, 'mvp_voting_results.csv'))
+        years = sorted(int(name[len('awards_'):-len('.html')])
+                       for name in os.listdir(os.path.join(fixtures, 'awards')) if name.startswith('awards_'))
+        base_url = f"file://{os.path.abspath(fixtures)}"
+
+        html_time, html_df = scrape('html', base_url, years)
+        print(f"{len(years)} pages, {len(html_df)} rows")
+        print(f"  html engine     : {html_time * 1000:8.1f} ms ({html_time / len(years) * 1000:.1f} ms/page)")
+
+        if args.selenium:
+            from driver_pool import create_driver
+
+            driver = create_driver(headless=True)
+            try:
+                selenium_time, selenium_df = scrape('selenium', base_url, years, driver)
+            finally:
+                driver.quit()
+            print(f"  selenium engine : {selenium_time * 1000:8.1f} ms ({selenium_time / html_time:.1f}x slower)")
+            if not selenium_df.equals(html_df):
+                print("MISMATCH between engines")
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Micro-benchmark: per-game dict loop vs columnar aggregation of playergamelog rowSets
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_log_stats import summarize_game_logs
+
+HEADERS = ['SEASON_ID', 'Player_ID', 'Game_ID', 'GAME_DATE', 'MATCHUP', 'WL', 'MIN',
+           'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT',
+           'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PTS', 'PLUS_MINUS']
+
+
+def legacy_summarize(headers, rows):
+    # The loop _get_traditional_stats used before the columnar rewrite
+    gp = len(rows)
+    totals = {
+        'MIN': 0, 'PTS': 0, 'REB': 0, 'AST': 0, 'STL': 0, 'BLK': 0,
+        'FGM': 0, 'FGA': 0, 'FG3M': 0, 'FG3A': 0, 'FTM': 0, 'FTA': 0
+    }
+    team = None
+    wins = 0
+    losses = 0
+
+    for row in rows:
+        row_dict = dict(zip(headers, row))
+        if team is None:
+            team = row_dict.get('MATCHUP', '').split()[0]
+        wl = row_dict.get('WL', '')
+        if wl == 'W':
+            wins += 1
+        elif wl == 'L':
+            losses += 1
+        for key in totals:
+            totals[key] += row_dict.get(key, 0) or 0
+
+    fg_pct = (totals['FGM'] / totals['FGA'] * 100) if totals['FGA'] > 0 else 0
+    fg3_pct = (totals['FG3M'] / totals['FG3A'] * 100) if totals['FG3A'] > 0 else 0
+    ft_pct = (totals['FTM'] / totals['FTA'] * 100) if totals['FTA'] > 0 else 0
+
+    return {
+        'GP': gp,
+        'MPG': round(totals['MIN'] / gp, 1),
+        'PTS': round(totals['PTS'] / gp, 1),
+        'REB': round(totals['REB'] / gp, 1),
+        'AST': round(totals['AST'] / gp, 1),
+        'STL': round(totals['STL'] / gp, 1),
+        'BLK': round(totals['BLK'] / gp, 1),
+        'FG_PCT': round(fg_pct, 1),
+        'FG3_PCT': round(fg3_pct, 1),
+        'FT_PCT': round(ft_pct, 1),
+        'TEAM': team or 'N/A',
+        'TEAM_WINS': wins,
+        'TEAM_LOSSES': losses
+    }
+
+
+def synthetic_logs(players, seed=0):
+    rng = random.Random(seed)
+    logs = {}
+    for player_id in range(players):
+        rows = []
+        for game in range(rng.randint(40, 82)):
+            fga = rng.randint(5, 25)
+            fg3a = rng.randint(0, 10)
+            fta = rng.randint(0, 12)
+            rows.append([
+                '22023', player_id, f"{game:08d}", '2024-01-01', 'BOS vs. LAL', rng.choice('WL'),
+                rng.randint(10, 42), rng.randint(0, fga), fga, None, rng.randint(0, fg3a), fg3a, None,
+                rng.randint(0, fta), fta, None, rng.randint(0, 4), rng.randint(0, 10),
+                rng.randint(0, 14), rng.randint(0, 12), rng.randint(0, 4), rng.randint(0, 4),
+                rng.randint(0, 5), rng.randint(0, 6), rng.randint(0, 50), rng.randint(-20, 20)
+            ])
+        logs[player_id] = (HEADERS, rows)
+    return logs
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--players', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    logs = synthetic_logs(args.players)
+    games = sum(len(rows) for _, rows in logs.values())
+    print(f"{args.players} players, {games} games (best of {args.repeat})")
+
+    legacy_time, legacy = best_of(
+        lambda: {pid: legacy_summarize(headers, rows) for pid, (headers, rows) in logs.items()},
+        args.repeat
+    )
+    columnar_time, columnar = best_of(lambda: summarize_game_logs(logs), args.repeat)
+
+    if legacy != columnar:
+        mismatched = [pid for pid in logs if legacy[pid] != columnar[pid]]
+        print(f"MISMATCH for {len(mismatched)} players, e.g. {mismatched[:5]}")
+        sys.exit(1)
+
+    print(f"  dict loop : {legacy_time * 1000:8.1f} ms")
+    print(f"  columnar  : {columnar_time * 1000:8.1f} ms ({legacy_time / columnar_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
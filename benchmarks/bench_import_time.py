@@ -0,0 +1,67 @@
+# Benchmark: cold-start import time of each CLI command, lazy vs the old eager imports
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cli import COMMANDS
+
+
+# What each module used to import at load time before heavy dependencies moved
+# into the code paths that use them
+EAGER_IMPORTS = {
+    'mvp_scraper': ['selenium.webdriver', 'selenium.webdriver.support.ui',
+                    'selenium.webdriver.support.expected_conditions', 'webdriver_manager.chrome'],
+    'mvp_analysis': ['matplotlib.pyplot', 'seaborn'],
+}
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'selenium', 'webdriver_manager', 'pymongo']
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ','.join(heavy))
+"""
+
+
+def time_import(modules, repeat):
+    # Fresh interpreter per sample so nothing is already in sys.modules
+    samples = []
+    heavy = ''
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', PROBE.format(heavy=HEAVY_MODULES)] + modules,
+                             cwd=ROOT, capture_output=True, text=True)
+        if out.returncode != 0:
+            return None, out.stderr.strip().splitlines()[-1]
+        elapsed, _, heavy = out.stdout.strip().partition(' ')
+        samples.append(float(elapsed))
+    return statistics.median(samples), heavy or '-'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'command':<10} {'module':<24} {'lazy ms':>9} {'eager ms':>9}  heavy modules loaded (lazy)")
+    for command, (module, _) in COMMANDS.items():
+        lazy, heavy = time_import([module], args.repeat)
+        if lazy is None:
+            print(f"{command:<10} {module:<24} {'n/a':>9} {'':>9}  {heavy}")
+            continue
+        eager = '-'
+        if module in EAGER_IMPORTS:
+            eager_time, _ = time_import(EAGER_IMPORTS[module] + [module], args.repeat)
+            eager = f"{eager_time * 1000:9.1f}" if eager_time is not None else 'n/a'
+        print(f"{command:<10} {module:<24} {lazy * 1000:9.1f} {eager:>9}  {heavy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# Local stand-in for basketball-reference and stats.nba.com that replays fixture files:
+#   /awards/awards_YYYY.html  -> <fixtures>/awards/
+#   /stats/<endpoint>?params  -> <fixtures>/stats/, looked up through stats/index.json
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from response_cache import cache_key
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    # Keep-alive, like the real hosts, so pooled sessions reuse their connections
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.startswith('/stats/'):
+            endpoint = url.path[len('/stats/'):].strip('/')
+            params = {name: values[0] for name, values in parse_qs(url.query, keep_blank_values=True).items()}
+            self._send(self.server.stats_body(endpoint, params), 'application/json')
+        else:
+            self._send(self.server.file_body(url.path), 'text/html; charset=utf-8')
+
+    def _send(self, body, content_type):
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, directory, host='127.0.0.1', port=0):
+        self.directory = os.path.abspath(directory)
+        index_path = os.path.join(self.directory, 'stats', 'index.json')
+        self.index = {}
+        if os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        # Bodies are read once; scaled copies share the same file
+        self._bodies = {}
+        self._lock = threading.Lock()
+        super().__init__((host, port), FixtureHandler)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _read(self, path):
+        with self._lock:
+            if path not in self._bodies:
+                try:
+                    with open(path, 'rb') as f:
+                        self._bodies[path] = f.read()
+                except OSError:
+                    return None
+            return self._bodies[path]
+
+    def stats_body(self, endpoint, params):
+        name = self.index.get(cache_key(endpoint, params))
+        return self._read(os.path.join(self.directory, 'stats', name)) if name else None
+
+    def file_body(self, path):
+        local = os.path.normpath(os.path.join(self.directory, path.lstrip('/')))
+        if not local.startswith(self.directory + os.sep):
+            return None
+        return self._read(local)
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self.url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve benchmark fixtures over HTTP")
+    parser.add_argument('fixtures', help="directory written by fixtures.py (awards/ and stats/)")
+    parser.add_argument('--port', type=int, default=0, help="0 picks a free port")
+    args = parser.parse_args()
+
+    server = FixtureServer(args.fixtures, port=args.port)
+    # First line is read by run_benchmarks.py to find the port
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# Synthetic basketball-reference award pages and stats.nba.com responses built from the
+# committed voting results and stats tables
+import json
+import os
+import random
+import sys
+from datetime import date, timedelta
+from html import escape
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from response_cache import cache_key
+
+
+AWARD_TABLE_IDS = ['mvp', 'roy', 'dpoy', 'smoy', 'mip', 'clutch_poy']
+
+GAME_LOG_HEADERS = ['SEASON_ID', 'Player_ID', 'Game_ID', 'GAME_DATE', 'MATCHUP', 'WL', 'MIN',
+                    'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT',
+                    'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PTS', 'PLUS_MINUS']
+ROSTER_HEADERS = ['PERSON_ID', 'DISPLAY_LAST_COMMA_FIRST', 'DISPLAY_FIRST_LAST', 'ROSTERSTATUS',
+                  'FROM_YEAR', 'TO_YEAR', 'PLAYERCODE']
+# commonallplayers (IsOnlyCurrentSeason=0) lists every player in league history
+ROSTER_SIZE = 5000
+
+
+def _voting_table(table_id, rows, rng):
+    body = []
+    for rank, (player, points) in enumerate(rows, start=1):
+        if rank % 20 == 0:
+            body.append('<tr class="thead"><th>Rank</th><td>Player</td><td>Pts Won</td></tr>')
+        body.append(
+            f'<tr><th scope="row" class="right" data-stat="rank">{rank}</th>'
+            f'<td class="left" data-stat="player" csk="{escape(player)}">'
+            f'<a href="/players/x/{rank:03d}.html">{escape(player)}</a></td>'
+            f'<td class="right" data-stat="age">{rng.randint(20, 36)}</td>'
+            f'<td class="left" data-stat="team_id"><a href="/teams/XXX/">XXX</a></td>'
+            f'<td class="right" data-stat="votes_first">{rng.randint(0, 100)}</td>'
+            f'<td class="right" data-stat="points_won">{points:g}</td>'
+            f'<td class="right" data-stat="points_max">1000</td>'
+            f'<td class="right" data-stat="award_share">{points / 1000:.3f}</td>'
+            f'<td class="right" data-stat="g">{rng.randint(55, 82)}</td>'
+            f'<td class="right" data-stat="pts_per_g">{rng.uniform(10, 35):.1f}</td>'
+            f'<td class="right" data-stat="trb_per_g">{rng.uniform(2, 14):.1f}</td>'
+            f'<td class="right" data-stat="ast_per_g">{rng.uniform(1, 11):.1f}</td>'
+            '</tr>'
+        )
+    return (
+        f'<table class="sortable stats_table" id="{table_id}">'
+        '<thead><tr><th data-stat="rank">Rank</th><th data-stat="player">Player</th>'
+        '<th data-stat="points_won">Pts Won</th></tr></thead>'
+        f'<tbody>{"".join(body)}</tbody></table>'
+    )
+
+
+def award_page_html(year, mvp_rows, comment_tables=True, seed=None):
+    # mvp_rows: [(player, points)]; also pads with sub-threshold rows and the other
+    # award tables, which the real site ships inside HTML comments
+    rng = random.Random(seed if seed is not None else year)
+    mvp_rows = list(mvp_rows) + [(f"Filler Player {i}", float(rng.randint(1, 100))) for i in range(8)]
+    sections = [f'<div class="table_container" id="div_mvp">{_voting_table("mvp", mvp_rows, rng)}</div>']
+
+    for table_id in AWARD_TABLE_IDS[1:]:
+        rows = [(f"{table_id.upper()} Candidate {i}", float(rng.randint(1, 500))) for i in range(12)]
+        table = _voting_table(table_id, rows, rng)
+        if comment_tables:
+            table = f'<!--\n{table}\n-->'
+        sections.append(f'<div class="table_wrapper" id="all_{table_id}">{table}</div>')
+
+    filler = ''.join(f'<p>{"Lorem ipsum dolor sit amet " * 20}</p>' for _ in range(30))
+    return (
+        f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{year - 1}-{str(year)[-2:]} NBA Awards Voting</title></head>'
+        f'<body><div id="content">{filler}{"".join(sections)}</div></body></html>'
+    )
+
+
+def scaled_name(player, copy):
+    return f"{player} {copy}" if copy else player
+
+
+def scale_table(df, scale):
+    # scale copies of every row, the copies under suffixed names; each season keeps its
+    # original rows first, matching the order write_award_pages puts them on the page
+    copies = [df.assign(Player=[scaled_name(player, copy) for player in df['Player']])
+              for copy in range(scale)]
+    return pd.concat(copies, ignore_index=True).sort_values('Season', kind='stable', ignore_index=True)
+
+
+def write_award_pages(directory, voting_csv, scale=1):
+    # scale > 1 repeats each season's candidates with suffixed names to grow the pages
+    voting = pd.read_csv(voting_csv)
+    awards_dir = os.path.join(directory, 'awards')
+    os.makedirs(awards_dir, exist_ok=True)
+    years = []
+    for year, season in voting.groupby('Year', sort=True):
+        rows = list(zip(season['Player'], season['Points']))
+        rows = rows + [(scaled_name(player, copy), points) for copy in range(1, scale) for player, points in rows]
+        with open(os.path.join(awards_dir, f"awards_{year}.html"), 'w', encoding='utf-8') as f:
+            f.write(award_page_html(int(year), rows))
+        years.append(int(year))
+    return years
+
+
+def _spread(total, games):
+    # Integer per-game values that add up to total exactly
+    base, extra = divmod(int(total), games)
+    return [base + (1 if game < extra else 0) for game in range(games)]
+
+
+def game_log_payload(row, player_id):
+    # playergamelog rowSet that reproduces the stored per-game averages (percentages to ~0.5)
+    games = int(row['GP'])
+    rng = random.Random(f"{row['Player']}|{row['Season']}")
+    columns = {}
+    for name in ['MPG', 'PTS', 'REB', 'AST', 'STL', 'BLK']:
+        values = _spread(round(float(row[name]) * games), games)
+        rng.shuffle(values)
+        columns[name] = values
+    fga = _spread(round(float(row['PTS']) * 0.8 * games), games)
+    fg3a = _spread(round(4 * games), games)
+    fta = _spread(round(5 * games), games)
+
+    def pct(name):
+        return (float(row[name]) if pd.notna(row[name]) else 0.0) / 100
+
+    fgm = _spread(round(sum(fga) * pct('FG_PCT')), games)
+    fg3m = _spread(round(sum(fg3a) * pct('FG3_PCT')), games)
+    ftm = _spread(round(sum(fta) * pct('FT_PCT')), games)
+
+    wins, _, losses = str(row['TEAM_RECORD']).partition('-')
+    wins = int(wins) if wins.isdigit() else games // 2
+    results = ['W' if game < wins else 'L' for game in range(games)]
+    rng.shuffle(results)
+
+    start_year = int(str(row['Season'])[:4])
+    opening = date(start_year, 10, 25)
+    rows = []
+    for game in range(games):
+        played = opening + timedelta(days=2 * game)
+        rows.append([
+            f"2{start_year}", player_id, f"002{str(start_year)[-2:]}{game + 1:05d}",
+            played.strftime('%b %d, %Y').upper(), f"{row['TEAM']} vs. OPP", results[game],
+            columns['MPG'][game], fgm[game], fga[game], None, fg3m[game], fg3a[game], None,
+            ftm[game], fta[game], None, 0, columns['REB'][game], columns['REB'][game],
+            columns['AST'][game], columns['STL'][game], columns['BLK'][game], rng.randint(0, 5),
+            rng.randint(0, 5), columns['PTS'][game], rng.randint(-20, 20),
+        ])
+    return {'resource': 'playergamelog', 'resultSets': [{'name': 'PlayerGameLog', 'headers': GAME_LOG_HEADERS,
+                                                        'rowSet': rows}]}
+
+
+def roster_payload(player_ids):
+    rows = [[player_id, name, name, 0, 2000, 2025, name.lower().replace(' ', '_')]
+            for name, player_id in player_ids.items()]
+    rows += [[900000 + i, f"Player, Roster {i}", f"Roster Player {i}", 0, 1990, 2000, f"roster_{i}"]
+             for i in range(max(0, ROSTER_SIZE - len(rows)))]
+    return {'resource': 'commonallplayers', 'resultSets': [{'name': 'CommonAllPlayers', 'headers': ROSTER_HEADERS,
+                                                           'rowSet': rows}]}
+
+
+def write_stats_fixtures(directory, stats_csv, voting_csv, scale=1):
+    # stats/index.json maps a request (response_cache.cache_key of endpoint + params) to a
+    # body file; scaled copies of a candidate replay that candidate's game log
+    stats = pd.read_csv(stats_csv)
+    voting = pd.read_csv(voting_csv)
+    stats_dir = os.path.join(directory, 'stats')
+    os.makedirs(stats_dir, exist_ok=True)
+
+    names = sorted({scaled_name(player, copy) for player in stats['Player'] for copy in range(scale)})
+    player_ids = {name: 1000 + i for i, name in enumerate(names)}
+    index = {}
+
+    def add_body(name, payload):
+        with open(os.path.join(stats_dir, name), 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+
+    add_body('commonallplayers.json', roster_payload(player_ids))
+    for season in sorted(voting['Season'].unique()):
+        params = {'LeagueID': '00', 'Season': season, 'IsOnlyCurrentSeason': '0'}
+        index[cache_key('commonallplayers', params)] = 'commonallplayers.json'
+
+    for number, row in stats.iterrows():
+        body = f"playergamelog_{number:04d}.json"
+        add_body(body, game_log_payload(row, player_ids[row['Player']]))
+        for copy in range(scale):
+            params = {'PlayerID': player_ids[scaled_name(row['Player'], copy)], 'Season': row['Season'],
+                      'SeasonType': 'Regular Season'}
+            index[cache_key('playergamelog', params)] = body
+
+    with open(os.path.join(stats_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    return len(index)
+
+
+def import_recorded_responses(directory, cache_path):
+    # Real captures: every response a collector run stored in its responses.sqlite replaces
+    # the synthetic body for the same request
+    import sqlite3
+    import zlib
+
+    stats_dir = os.path.join(directory, 'stats')
+    index_path = os.path.join(stats_dir, 'index.json')
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+
+    conn = sqlite3.connect(f"file:{cache_path}?mode=ro", uri=True)
+    try:
+        recorded = conn.execute("SELECT key, endpoint, body FROM responses").fetchall()
+    finally:
+        conn.close()
+    for key, endpoint, body in recorded:
+        name = f"recorded_{key[:16]}.json"
+        with open(os.path.join(stats_dir, name), 'wb') as f:
+            f.write(zlib.decompress(body))
+        index[key] = name
+
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    return len(recorded)
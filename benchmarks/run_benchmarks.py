@@ -0,0 +1,275 @@
+# End-to-end benchmark of the four pipeline stages against replayed fixtures:
+#   scrape  - award pages through the html engine, from the local fixture server
+#   collect - stats.nba.com roster + game logs through NBAStatsCollector, same server
+#   load    - upsert_candidates into mongomock (or a local mongod with --mongo-uri)
+#   analyze - MVPAnalyzer.run_full_analysis in draft mode
+# Each stage runs at 1x/10x/100x the committed tables, every run in a fresh process so
+# imports, caches and peak RSS are not shared between stages
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from fixtures import scale_table, write_award_pages, write_stats_fixtures
+
+STAGES = ['scrape', 'collect', 'load', 'analyze']
+# Imported before the clock starts, so wall time is the stage itself
+STAGE_MODULES = {'scrape': 'mvp_scraper', 'collect': 'nba_stats_collector',
+                 'load': 'mvp_complete_collection', 'analyze': 'mvp_analysis'}
+DEFAULT_SCALES = [1, 10, 100]
+RESULTS_VERSION = 1
+
+
+class Workspace:
+    # Per-scale inputs, fixture files and the fixture server shared by every stage run
+
+    def __init__(self, directory, scale, args):
+        self.directory = directory
+        self.scale = scale
+        voting = pd.read_csv(os.path.join(ROOT, 'mvp_voting_results.csv'))
+        stats = pd.read_csv(os.path.join(ROOT, 'mvp_complete_stats.csv'))
+        self.voting_csv = os.path.join(directory, 'voting.csv')
+        self.stats_csv = os.path.join(directory, 'stats.csv')
+        scale_table(voting, scale).to_csv(self.voting_csv, index=False)
+        scale_table(stats, scale).to_csv(self.stats_csv, index=False)
+
+        fixtures = os.path.join(directory, 'fixtures')
+        self.years = write_award_pages(fixtures, os.path.join(ROOT, 'mvp_voting_results.csv'), scale)
+        write_stats_fixtures(fixtures, os.path.join(ROOT, 'mvp_complete_stats.csv'),
+                             os.path.join(ROOT, 'mvp_voting_results.csv'), scale)
+        if args.recorded_cache and scale == 1:
+            from fixtures import import_recorded_responses
+
+            import_recorded_responses(fixtures, args.recorded_cache)
+
+        # Separate process, so serving the fixtures is not charged to the stage being measured
+        self.server = subprocess.Popen([sys.executable, os.path.join(ROOT, 'benchmarks', 'fixture_server.py'),
+                                        fixtures], stdout=subprocess.PIPE, text=True)
+        self.url = self.server.stdout.readline().strip()
+        self.settings = os.path.join(directory, 'workspace.json')
+        with open(self.settings, 'w', encoding='utf-8') as f:
+            json.dump({'directory': directory, 'scale': scale, 'url': self.url, 'years': self.years,
+                       'voting_csv': self.voting_csv, 'stats_csv': self.stats_csv,
+                       'workers': args.workers, 'mongo_uri': args.mongo_uri}, f)
+
+    def close(self):
+        self.server.terminate()
+        self.server.wait()
+
+
+def run_scrape(workspace, run_dir):
+    from mvp_scraper import MVPSeleniumScraper
+
+    scraper = MVPSeleniumScraper(start_year=min(workspace.years), end_year=max(workspace.years),
+                                 workers=workspace.workers, base_url=workspace.url,
+                                 pages_per_second=1000, engine='html')
+    return len(scraper.scrape_all_data())
+
+
+def run_collect(workspace, run_dir):
+    from nba_stats_collector import NBAStatsCollector
+    from mvp_storage import read_complete_stats
+
+    # At least two workers: the serial path sleeps between candidates to be polite to the API
+    workers = max(2, workspace.workers)
+    collector = NBAStatsCollector(cache_dir=os.path.join(run_dir, 'cache'), requests_per_second=1000,
+                                  base_url=f"{workspace.url}/stats", pool_size=workers)
+    output = os.path.join(run_dir, 'complete.csv')
+    collector.scrape_all_stats(workspace.voting_csv, output, workers=workers)
+    collector.transport.close()
+    return len(read_complete_stats(output))
+
+
+def run_load(workspace, run_dir):
+    from mvp_complete_collection import upsert_candidates
+    from mvp_storage import read_complete_stats
+
+    if workspace.mongo_uri:
+        from pymongo import MongoClient
+
+        client = MongoClient(workspace.mongo_uri)
+    else:
+        import mongomock
+
+        client = mongomock.MongoClient()
+    try:
+        client.drop_database('nba_mvp_benchmark')
+        collection = client['nba_mvp_benchmark']['mvp_candidates']
+        totals = upsert_candidates(collection, read_complete_stats(workspace.stats_csv))
+        client.drop_database('nba_mvp_benchmark')
+    finally:
+        client.close()
+    return totals['documents']
+
+
+def run_analyze(workspace, run_dir):
+    from mvp_analysis import MVPAnalyzer
+
+    # The analyzer writes mvp_analysis_plots/ under the working directory
+    cwd = os.getcwd()
+    os.chdir(run_dir)
+    try:
+        analyzer = MVPAnalyzer(workspace.stats_csv, draft=True, plot_workers=workspace.workers)
+        analyzer.run_full_analysis()
+    finally:
+        os.chdir(cwd)
+    return int(analyzer.overview['candidates'])
+
+
+RUNNERS = {'scrape': run_scrape, 'collect': run_collect, 'load': run_load, 'analyze': run_analyze}
+
+
+def peak_rss_mb(who):
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_stage(stage, settings):
+    # Child side: one stage, one fresh run directory; prints a JSON line for the parent
+    with open(settings, 'r', encoding='utf-8') as f:
+        workspace = argparse.Namespace(**json.load(f))
+    importlib.import_module(STAGE_MODULES[stage])
+    with tempfile.TemporaryDirectory(prefix=f"{stage}_", dir=workspace.directory) as run_dir:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            rows = RUNNERS[stage](workspace, run_dir)
+        elapsed = time.perf_counter() - start
+    # Plot rendering happens in pool processes, so their peak counts too
+    peak = max(peak_rss_mb(resource.RUSAGE_SELF), peak_rss_mb(resource.RUSAGE_CHILDREN))
+    print(json.dumps({'rows': rows, 'wall_s': elapsed, 'peak_mb': peak}))
+
+
+def measure(stage, workspace):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--run-stage', stage,
+                          '--settings', workspace.settings], capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"{stage} at {workspace.scale}x failed:\n{out.stderr}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def benchmark(stage, workspace, repeat):
+    # Fastest wall time and smallest peak of the repeats, the least noisy estimate of each
+    runs = [measure(stage, workspace) for _ in range(repeat)]
+    result = {'stage': stage, 'scale': workspace.scale, 'rows': runs[0]['rows'],
+              'wall_s': min(run['wall_s'] for run in runs), 'peak_mb': min(run['peak_mb'] for run in runs)}
+    result['rows_per_s'] = result['rows'] / result['wall_s'] if result['wall_s'] > 0 else float('inf')
+    return result
+
+
+def compare(results, baseline, tolerance, memory_tolerance, min_slowdown=0.05):
+    # A stage regresses when it is slower or larger than the baseline beyond the tolerance.
+    # Wall time must also grow by at least min_slowdown seconds: sub-second stages jitter
+    # by more than the tolerance between identical runs
+    regressions = []
+    for key, result in results.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        checks = [('wall_s', tolerance, min_slowdown), ('peak_mb', memory_tolerance, 0)]
+        for metric, allowed, min_delta in checks:
+            if result.get(metric) is None or before.get(metric) is None or before[metric] <= 0:
+                continue
+            ratio = result[metric] / before[metric]
+            result[f"{metric}_ratio"] = ratio
+            if ratio > 1 + allowed and result[metric] - before[metric] >= min_delta:
+                regressions.append(f"{key} {metric}: {before[metric]:.3f} -> {result[metric]:.3f} "
+                                   f"({(ratio - 1) * 100:+.0f}%, allowed {allowed * 100:.0f}%)")
+    return regressions
+
+
+def machine_info():
+    return {'python': platform.python_version(), 'platform': platform.platform(), 'cpus': os.cpu_count()}
+
+
+def print_results(results):
+    print(f"\n{'Stage':<8} {'Scale':>6} {'Rows':>7} {'Wall s':>8} {'Peak MB':>8} {'Rows/s':>9} "
+          f"{'vs base':>8} {'mem vs':>7}")
+    for result in results.values():
+        wall_ratio = f"{result['wall_s_ratio']:7.2f}x" if 'wall_s_ratio' in result else f"{'-':>8}"
+        peak_ratio = f"{result['peak_mb_ratio']:6.2f}x" if 'peak_mb_ratio' in result else f"{'-':>7}"
+        print(f"{result['stage']:<8} {result['scale']:>5}x {result['rows']:>7} {result['wall_s']:8.2f} {result['peak_mb']:8.1f} "
+              f"{result['rows_per_s']:9.0f} {wall_ratio} {peak_ratio}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scrape/collect/load/analyze on replayed fixtures")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--scales', default=','.join(str(scale) for scale in DEFAULT_SCALES),
+                        help="comma-separated multiples of the committed tables")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per stage; the best is kept")
+    parser.add_argument('--workers', type=int, default=4, help="scraper/collector threads and plot processes")
+    parser.add_argument('--mongo-uri', default=None, help="load into this mongod instead of mongomock")
+    parser.add_argument('--recorded-cache', default=None,
+                        help="responses.sqlite from a real collector run, replayed at scale 1")
+    parser.add_argument('--baseline', help="results JSON from an earlier run to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed wall time increase (0.25 = 25%%)")
+    parser.add_argument('--min-slowdown', type=float, default=0.05,
+                        help="seconds a stage must slow down by before it counts as a regression")
+    parser.add_argument('--memory-tolerance', type=float, default=0.10, help="allowed peak memory increase")
+    parser.add_argument('--output', help="write this run's results JSON here (use it as a later --baseline)")
+    parser.add_argument('--run-stage', choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument('--settings', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_stage:
+        run_stage(args.run_stage, args.settings)
+        return
+
+    stages = list(args.stages)
+    if 'load' in stages and not args.mongo_uri and importlib.util.find_spec('mongomock') is None:
+        print("Skipping load: install mongomock or pass --mongo-uri")
+        stages.remove('load')
+
+    scales = [int(scale) for scale in args.scales.split(',')]
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='mvp_bench_') as tmp:
+        for scale in scales:
+            directory = os.path.join(tmp, f"x{scale}")
+            os.makedirs(directory)
+            workspace = Workspace(directory, scale, args)
+            try:
+                for stage in stages:
+                    print(f"{stage} at {scale}x...", flush=True)
+                    results[f"{stage}@{scale}"] = benchmark(stage, workspace, args.repeat)
+            finally:
+                workspace.close()
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('machine') != machine_info():
+            print(f"Note: baseline was recorded on {baseline.get('machine')}")
+        regressions = compare(results, baseline['results'], args.tolerance, args.memory_tolerance,
+                              args.min_slowdown)
+
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': RESULTS_VERSION, 'machine': machine_info(), 'results': results}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if regressions:
+        print("\nREGRESSIONS:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Append-only, crash-safe checkpoint log for collector results
+import json
+
+import pandas as pd
+
+from mvp_storage import write_complete_stats
+from sqlite_store import SQLiteStore
+
+
+def _json_default(value):
+    # numpy scalars coming out of DataFrame rows
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class CheckpointStore(SQLiteStore):
+
+    def __init__(self, path):
+        super().__init__(path, """
+            CREATE TABLE IF NOT EXISTS results (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                player TEXT NOT NULL,
+                season TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                UNIQUE (player, season)
+            )
+        """)
+
+    def completed_keys(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT player, season FROM results").fetchall()
+        return set(rows)
+
+    def append(self, result):
+        # One small transaction per candidate; a crash loses at most the row in flight
+        payload = json.dumps(result, default=_json_default)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (player, season, payload) VALUES (?, ?, ?)",
+                (result['Player'], result['Season'], payload)
+            )
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def to_frame(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT payload FROM results ORDER BY seq").fetchall()
+        return pd.DataFrame([json.loads(payload) for (payload,) in rows])
+
+    def compact(self, output_path, existing=None):
+        # Merge previously exported rows with the log and write the export exactly once;
+        # mvp_storage writes through a temp path + rename so readers never see a partial table
+        frames = [frame for frame in (existing, self.to_frame()) if frame is not None and not frame.empty]
+        if not frames:
+            return existing
+        final_df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        final_df = final_df.drop_duplicates(subset=['Player', 'Season'], keep='last').reset_index(drop=True)
+
+        write_complete_stats(final_df, output_path)
+
+        # The export now holds every row, so the log can start over
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+        return final_df
@@ -0,0 +1,42 @@
+# Single entry point for the pipeline: python cli.py <command> [options]
+import importlib
+import sys
+
+
+# command -> (module, description); a module is imported only when its command runs,
+# so e.g. "collect" never loads matplotlib and "analyze" never loads Selenium
+COMMANDS = {
+    'scrape': ('mvp_scraper', "Scrape award voting from basketball-reference"),
+    'collect': ('nba_stats_collector', "Collect season stats for MVP candidates"),
+    'load': ('mvp_complete_collection', "Load complete stats into MongoDB"),
+    'metrics': ('metrics', "Recompute derived metrics on a stored table (no network)"),
+    'analyze': ('mvp_analysis', "Analyze historical MVP candidates and render plots"),
+    'predict': ('mvp_predictor', "Train, cross-validate and apply the MVP vote-share model"),
+    'backtest': ('backtest', "Leave-one-season-out backtest over a ridge penalty grid"),
+}
+
+
+def usage():
+    lines = ["usage: cli.py <command> [options]", "", "commands:"]
+    lines += [f"  {name:<10} {description}" for name, (_, description) in COMMANDS.items()]
+    lines += ["", "Run 'cli.py <command> -h' for a command's options."]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage())
+        return 0
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"cli.py: unknown command {command!r}\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    module = importlib.import_module(COMMANDS[command][0])
+    module.main(rest, prog=f"cli.py {command}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# Pool of long-lived Chrome WebDriver sessions shared across award pages
+import queue
+import threading
+from contextlib import contextmanager
+
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def chromedriver_path():
+    # ChromeDriverManager().install() checks versions over the network; do it once per process
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+def chrome_options(headless):
+    # Selenium is imported here rather than at module level so importing the
+    # scraper for its DataFrame helpers does not pay for it
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+
+    if headless:
+        chrome_options.add_argument('--headless')
+
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    return chrome_options
+
+
+def create_driver(headless=False, remote_url=None):
+    # remote_url points at a long-lived Selenium server/Grid, so browser processes
+    # outlive a single scraper run; otherwise a local Chrome is launched
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    options = chrome_options(headless)
+    if remote_url:
+        driver = webdriver.Remote(command_executor=remote_url, options=options)
+    else:
+        driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+class DriverPool:
+
+    def __init__(self, size=1, headless=True, remote_url=None):
+        self.size = size
+        self.headless = headless
+        self.remote_url = remote_url
+        self._drivers = []
+        self._idle = queue.Queue()
+
+    def start(self):
+        if self._drivers:
+            return self
+        for _ in range(self.size):
+            driver = create_driver(self.headless, self.remote_url)
+            self._drivers.append(driver)
+            self._idle.put(driver)
+        print(f"Started {self.size} browser session(s)")
+        return self
+
+    @contextmanager
+    def acquire(self):
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+
+    def close(self):
+        print("\nClosing browser...")
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._drivers = []
+        self._idle = queue.Queue()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
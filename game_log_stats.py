@@ -0,0 +1,157 @@
+# Columnar aggregation of playergamelog result sets into season averages
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+COUNTING_STATS = ['MIN', 'PTS', 'REB', 'AST', 'STL', 'BLK',
+                  'FGM', 'FGA', 'FG3M', 'FG3A', 'FTM', 'FTA']
+
+
+def summarize_totals(gp, totals, team, wins, losses):
+    # Same rounding and keys as the original per-game loop in NBAStatsCollector
+    fg_pct = (totals['FGM'] / totals['FGA'] * 100) if totals['FGA'] > 0 else 0
+    fg3_pct = (totals['FG3M'] / totals['FG3A'] * 100) if totals['FG3A'] > 0 else 0
+    ft_pct = (totals['FTM'] / totals['FTA'] * 100) if totals['FTA'] > 0 else 0
+
+    return {
+        'GP': gp,
+        'MPG': round(totals['MIN'] / gp, 1),
+        'PTS': round(totals['PTS'] / gp, 1),
+        'REB': round(totals['REB'] / gp, 1),
+        'AST': round(totals['AST'] / gp, 1),
+        'STL': round(totals['STL'] / gp, 1),
+        'BLK': round(totals['BLK'] / gp, 1),
+        'FG_PCT': round(fg_pct, 1),
+        'FG3_PCT': round(fg3_pct, 1),
+        'FT_PCT': round(ft_pct, 1),
+        'TEAM': team or 'N/A',
+        'TEAM_WINS': wins,
+        'TEAM_LOSSES': losses
+    }
+
+
+def _numeric_column(values):
+    # None -> 0 like the old `or 0`; anything unparsable also counts as 0
+    try:
+        column = np.array(values, dtype=float)
+    except (TypeError, ValueError):
+        column = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+    return np.nan_to_num(column, copy=False)
+
+
+def _summarize_layout(headers, players):
+    # players: [(player_id, rows)] sharing one header layout; rows stay contiguous
+    # per player so np.add.reduceat can total every player in one pass
+    position = {header: i for i, header in enumerate(headers)}
+    lengths = np.array([len(rows) for _, rows in players])
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    columns = list(zip(*[row for _, rows in players for row in rows]))
+
+    stat_matrix = np.zeros((len(COUNTING_STATS), len(columns[0]) if columns else 0))
+    for k, stat in enumerate(COUNTING_STATS):
+        if stat in position:
+            stat_matrix[k] = _numeric_column(columns[position[stat]])
+    totals = np.add.reduceat(stat_matrix, offsets, axis=1)
+
+    if 'WL' in position:
+        results = np.array(columns[position['WL']], dtype=object)
+        wins = np.add.reduceat(results == 'W', offsets)
+        losses = np.add.reduceat(results == 'L', offsets)
+    else:
+        wins = losses = np.zeros(len(players), dtype=np.int64)
+
+    matchup_at = position.get('MATCHUP')
+    summaries = {}
+    for i, (player_id, rows) in enumerate(players):
+        matchup = rows[0][matchup_at] if matchup_at is not None else ''
+        team = matchup.split()[0] if matchup and matchup.split() else None
+        player_totals = dict(zip(COUNTING_STATS, totals[:, i].tolist()))
+        summaries[player_id] = summarize_totals(
+            int(lengths[i]), player_totals, team, int(wins[i]), int(losses[i])
+        )
+    return summaries
+
+
+def summarize_game_logs(logs):
+    # logs: {player_id: (headers, rowSet)} -> {player_id: stats dict or None}
+    summaries = {player_id: None for player_id in logs}
+
+    layouts = {}
+    for player_id, (headers, rows) in logs.items():
+        if rows:
+            layouts.setdefault(tuple(headers), []).append((player_id, rows))
+
+    for headers, players in layouts.items():
+        summaries.update(_summarize_layout(headers, players))
+
+    return summaries
+
+
+def summarize_game_log(headers, rows):
+    if not rows:
+        return None
+    return summarize_game_logs({0: (headers, rows)})[0]
+
+
+def parse_game_date(text):
+    # playergamelog sends "APR 13, 2025"; other endpoints use ISO dates
+    text = str(text).strip()
+    for fmt in ('%b %d, %Y', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(text.title() if fmt == '%b %d, %Y' else text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized game date: {text!r}")
+
+
+def empty_running_totals():
+    return {'gp': 0, 'totals': {stat: 0.0 for stat in COUNTING_STATS}, 'team': None,
+            'wins': 0, 'losses': 0, 'last_game_date': None, 'game_ids': []}
+
+
+def accumulate_game_log(state, headers, rows):
+    # Fold game-log rows into running season totals; games already counted (by Game_ID)
+    # are skipped, so overlapping fetches are harmless. Returns (state, new games added)
+    state = state or empty_running_totals()
+    position = {header: i for i, header in enumerate(headers)}
+    game_id_at = position.get('Game_ID', position.get('GAME_ID'))
+    seen = set(state['game_ids'])
+    new_rows = [row for row in rows if game_id_at is None or row[game_id_at] not in seen]
+    if not new_rows:
+        return state, 0
+
+    columns = list(zip(*new_rows))
+    totals = dict(state['totals'])
+    for stat in COUNTING_STATS:
+        if stat in position:
+            totals[stat] = totals.get(stat, 0.0) + float(_numeric_column(columns[position[stat]]).sum())
+
+    results = columns[position['WL']] if 'WL' in position else ()
+    dates = [parse_game_date(text) for text in columns[position['GAME_DATE']]] if 'GAME_DATE' in position else []
+    last_game_date = state['last_game_date']
+    if dates:
+        newest = max(dates).isoformat()
+        if last_game_date is None or newest >= last_game_date:
+            last_game_date = newest
+            # Team from the most recent game, as summarize_game_log takes it from rows[0]
+            matchup = columns[position['MATCHUP']][dates.index(max(dates))] if 'MATCHUP' in position else ''
+            if matchup and matchup.split():
+                state = dict(state, team=matchup.split()[0])
+
+    return dict(
+        state,
+        gp=state['gp'] + len(new_rows),
+        totals=totals,
+        wins=state['wins'] + sum(1 for result in results if result == 'W'),
+        losses=state['losses'] + sum(1 for result in results if result == 'L'),
+        last_game_date=last_game_date,
+        game_ids=state['game_ids'] + ([row[game_id_at] for row in new_rows] if game_id_at is not None else []),
+    ), len(new_rows)
+
+
+def summarize_running_totals(state):
+    if not state or state['gp'] == 0:
+        return None
+    return summarize_totals(state['gp'], state['totals'], state['team'], state['wins'], state['losses'])
@@ -0,0 +1,182 @@
+# Run telemetry for the collector: counters, latency histograms, bytes and stage timings,
+# reported as a text summary and a JSON trace that can be diffed between runs
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import numpy as np
+
+
+TRACE_VERSION = 1
+# Raw events kept for the trace; counters and histogram count/total/min/max always cover the whole run
+MAX_TRACE_EVENTS = 50000
+# Latency samples kept per histogram for percentiles; past this, a uniform reservoir sample
+MAX_HISTOGRAM_SAMPLES = 10000
+
+
+def histogram_summary(samples, count=None, total=None, low=None, high=None):
+    # count/total/low/high override the sample-derived values when samples is a reservoir
+    values = np.asarray(samples, dtype=float)
+    if values.size == 0:
+        return {'count': 0}
+    count = int(values.size) if count is None else count
+    total = float(values.sum()) if total is None else total
+    low = float(values.min()) if low is None else low
+    high = float(values.max()) if high is None else high
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {
+        'count': count,
+        'total_s': total,
+        'mean_ms': total / count * 1000,
+        'min_ms': low * 1000,
+        'p50_ms': float(p50 * 1000),
+        'p90_ms': float(p90 * 1000),
+        'p99_ms': float(p99 * 1000),
+        'max_ms': high * 1000,
+    }
+
+
+class LatencyHistogram:
+    # Exact count/total/min/max plus a bounded reservoir of samples for the percentiles
+
+    def __init__(self, max_samples=MAX_HISTOGRAM_SAMPLES):
+        self.max_samples = max_samples
+        self.samples = []
+        self.count = 0
+        self.total = 0.0
+        self.low = float('inf')
+        self.high = float('-inf')
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.low = min(self.low, seconds)
+        self.high = max(self.high, seconds)
+        if len(self.samples) < self.max_samples:
+            self.samples.append(seconds)
+        else:
+            # Algorithm R: every sample seen so far is kept with equal probability
+            slot = random.randrange(self.count)
+            if slot < self.max_samples:
+                self.samples[slot] = seconds
+
+    def summary(self):
+        if not self.count:
+            return {'count': 0}
+        return histogram_summary(self.samples, self.count, self.total, self.low, self.high)
+
+
+class Telemetry:
+
+    def __init__(self, name='run'):
+        self.name = name
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.counters = defaultdict(int)
+        self.histograms = defaultdict(LatencyHistogram)
+        self.events = []
+        self.dropped_events = 0
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+
+    def observe(self, name, seconds, **attrs):
+        # One timed occurrence: histogram sample plus (while there is room) a trace event
+        with self._lock:
+            self.histograms[name].add(seconds)
+            if len(self.events) < MAX_TRACE_EVENTS:
+                event = {'name': name, 'end_s': round(time.perf_counter() - self._start, 6),
+                         'duration_ms': round(seconds * 1000, 3)}
+                if attrs:
+                    event['attrs'] = attrs
+                self.events.append(event)
+            else:
+                self.dropped_events += 1
+
+    @contextmanager
+    def stage(self, name, **attrs):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(f"stage.{name}", time.perf_counter() - start, **attrs)
+
+    def record_request(self, endpoint, seconds, status=None, size=0, attempt=0, error=None):
+        self.count(f"http.{endpoint}.requests")
+        if attempt:
+            self.count(f"http.{endpoint}.retries")
+        if error is not None:
+            self.count(f"http.{endpoint}.errors")
+        elif status is not None:
+            self.count(f"http.{endpoint}.status.{status}")
+        self.count(f"http.{endpoint}.bytes", size)
+        attrs = {'status': status, 'bytes': size, 'attempt': attempt}
+        if error is not None:
+            attrs['error'] = type(error).__name__
+        self.observe(f"http.{endpoint}", seconds, **attrs)
+
+    def summary(self):
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = {name: histogram.summary() for name, histogram in self.histograms.items()}
+        return {
+            'version': TRACE_VERSION,
+            'name': self.name,
+            'started_at': self.started_at,
+            'wall_s': time.perf_counter() - self._start,
+            'counters': dict(sorted(counters.items())),
+            'histograms': dict(sorted(histograms.items())),
+        }
+
+    def write_trace(self, path):
+        trace = self.summary()
+        with self._lock:
+            trace['events'] = list(self.events)
+            trace['dropped_events'] = self.dropped_events
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, indent=2)
+        return path
+
+    def report(self):
+        summary = self.summary()
+        counters = summary['counters']
+        wall = summary['wall_s']
+        lines = [f"\nTELEMETRY ({self.name}, {wall:.1f}s wall)"]
+
+        endpoints = sorted({name.split('.')[1] for name in counters if name.startswith('http.')} |
+                           {name.split('.')[1] for name in counters if name.startswith('cache.')})
+        if endpoints:
+            lines.append(f"\n{'Endpoint':<22} {'Reqs':>5} {'Retry':>5} {'Err':>4} {'KB':>9} "
+                         f"{'p50 ms':>8} {'p90 ms':>8} {'max ms':>8} {'Hit':>5} {'Miss':>5} {'Stale':>5} {'304':>4}")
+            for endpoint in endpoints:
+                latency = summary['histograms'].get(f"http.{endpoint}", {'count': 0})
+                lines.append(
+                    f"{endpoint:<22} {counters.get(f'http.{endpoint}.requests', 0):>5} "
+                    f"{counters.get(f'http.{endpoint}.retries', 0):>5} "
+                    f"{counters.get(f'http.{endpoint}.errors', 0):>4} "
+                    f"{counters.get(f'http.{endpoint}.bytes', 0) / 1024:>9.1f} "
+                    f"{latency.get('p50_ms', 0):>8.1f} {latency.get('p90_ms', 0):>8.1f} "
+                    f"{latency.get('max_ms', 0):>8.1f} {counters.get(f'cache.{endpoint}.hit', 0):>5} "
+                    f"{counters.get(f'cache.{endpoint}.miss', 0):>5} "
+                    f"{counters.get(f'cache.{endpoint}.stale', 0):>5} "
+                    f"{counters.get(f'cache.{endpoint}.not_modified', 0):>4}"
+                )
+
+        stages = {name[len('stage.'):]: stats for name, stats in summary['histograms'].items()
+                  if name.startswith('stage.')}
+        if stages:
+            lines.append(f"\n{'Stage':<22} {'Count':>6} {'Total s':>9} {'% wall':>7} {'p50 ms':>8} {'max ms':>8}")
+            for name, stats in sorted(stages.items(), key=lambda item: -item[1]['total_s']):
+                share = stats['total_s'] / wall * 100 if wall > 0 else 0
+                lines.append(f"{name:<22} {stats['count']:>6} {stats['total_s']:>9.2f} {share:>6.1f}% "
+                             f"{stats['p50_ms']:>8.1f} {stats['max_ms']:>8.1f}")
+        lines.append("(stages can overlap with concurrent workers, so % wall may sum past 100)")
+
+        text = "\n".join(lines)
+        print(text)
+        return text
@@ -0,0 +1,164 @@
+# Derived-metric registry: named formulas over stat columns, evaluated on one stats dict
+# or on a whole DataFrame at once
+import numpy as np
+import pandas as pd
+
+
+class Metric:
+
+    def __init__(self, name, inputs, formula, decimals=1, description=''):
+        self.name = name
+        self.inputs = list(inputs)
+        # formula(columns) -> value; columns maps input name -> float or float array,
+        # so the same arithmetic serves a single candidate and a full table
+        self.formula = formula
+        self.decimals = decimals
+        self.description = description
+
+
+METRICS = {}
+
+# What the collector writes into mvp_complete_stats
+STORED_METRICS = ['TEAM_WIN_PCT', 'GAME_SCORE', 'SIMPLE_PER', 'IMPACT_SCORE']
+
+
+def register(name, inputs, decimals=1, description=''):
+    def decorator(formula):
+        METRICS[name] = Metric(name, inputs, formula, decimals, description)
+        return formula
+    return decorator
+
+
+def register_linear(name, weights, decimals=1, description=''):
+    # Weighted sum of columns, e.g. {'PTS': 1.0, 'REB': 0.4}
+    weights = dict(weights)
+
+    def formula(columns):
+        return sum(weight * columns[column] for column, weight in weights.items())
+
+    METRICS[name] = Metric(name, weights, formula, decimals, description)
+
+
+register_linear('GAME_SCORE', {'PTS': 1.0, 'REB': 0.4, 'AST': 0.7, 'STL': 1.0, 'BLK': 0.7},
+                description="All-around performance metric")
+register_linear('IMPACT_SCORE', {'PTS': 1.0, 'REB': 0.7, 'AST': 0.7, 'STL': 1.5, 'BLK': 1.5},
+                description="All-around metric weighted toward defensive stats")
+register_linear('STOCKS', {'STL': 1.0, 'BLK': 1.0}, description="Steals plus blocks per game")
+
+
+@register('SIMPLE_PER', ['PTS', 'REB', 'AST', 'STL', 'BLK'], description="Mean of the big 5 per-game stats")
+def simple_per(columns):
+    return (columns['PTS'] + columns['REB'] + columns['AST'] + columns['STL'] + columns['BLK']) / 5
+
+
+@register('TEAM_WIN_PCT', ['TEAM_WINS', 'TEAM_LOSSES'], description="Win % over the games played")
+def team_win_pct(columns):
+    wins, losses = columns['TEAM_WINS'], columns['TEAM_LOSSES']
+    games = wins + losses
+    if np.ndim(games) == 0:
+        return wins / games * 100 if games > 0 else None
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(games > 0, wins / games * 100, np.nan)
+
+
+@register('PTS_PER_36', ['PTS', 'MPG'], description="Scoring volume per 36 minutes (usage proxy)")
+def points_per_36(columns):
+    pts, mpg = columns['PTS'], columns['MPG']
+    if np.ndim(mpg) == 0:
+        return pts / mpg * 36 if mpg > 0 else None
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(mpg > 0, pts / mpg * 36, np.nan)
+
+
+def round_like_python(values, decimals):
+    # np.round and round() only disagree on exact binary halves (e.g. 0.15 -> 0.1 vs 0.2);
+    # those few near-ties go through round() so bulk results match the per-dict path
+    rounded = np.round(values, decimals)
+    scaled = values * 10 ** decimals
+    ties = np.flatnonzero(np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-9)
+    for i in ties:
+        rounded[i] = round(float(values[i]), decimals)
+    return rounded
+
+
+def record_columns(df):
+    # Stored tables carry TEAM_RECORD ("W-L" or "N/A") rather than the raw counters
+    if 'TEAM_WINS' in df.columns or 'TEAM_RECORD' not in df.columns:
+        return df
+    parts = df['TEAM_RECORD'].astype(str).str.extract(r'^(\d+)-(\d+)$').astype(float)
+    return df.assign(TEAM_WINS=parts[0].fillna(0), TEAM_LOSSES=parts[1].fillna(0))
+
+
+def compute_metrics(data, names=None):
+    # dict in -> dict out (collector path); DataFrame in -> DataFrame of metric columns.
+    # Missing inputs count as 0, as stats.get(column, 0) did in the collector
+    names = list(names or STORED_METRICS)
+    metrics = [METRICS[name] for name in names]
+
+    if isinstance(data, pd.DataFrame):
+        df = record_columns(data)
+        columns = {}
+        for metric in metrics:
+            for column in metric.inputs:
+                if column not in columns:
+                    values = pd.to_numeric(df[column], errors='coerce') if column in df.columns else 0.0
+                    columns[column] = np.nan_to_num(np.broadcast_to(np.asarray(values, dtype=float), len(df)))
+        out = {}
+        for metric in metrics:
+            values = np.asarray(metric.formula(columns), dtype=float)
+            out[metric.name] = round_like_python(values, metric.decimals)
+        return pd.DataFrame(out, index=data.index)
+
+    columns = {column: data.get(column, 0) for metric in metrics for column in metric.inputs}
+    out = {}
+    for metric in metrics:
+        value = metric.formula(columns)
+        out[metric.name] = round(value, metric.decimals) if value is not None else None
+    return out
+
+
+def recompute(path, names=None, output=None):
+    # Offline: rewrite the metric columns of a stored table without touching the network
+    import time
+
+    from mvp_storage import read_complete_stats, write_complete_stats
+
+    df = read_complete_stats(path)
+    start = time.perf_counter()
+    metrics = compute_metrics(df, names)
+    elapsed = time.perf_counter() - start
+
+    changed = 0
+    for name in metrics.columns:
+        if name in df.columns:
+            old = pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=float)
+            changed += int((~np.isclose(old, metrics[name].to_numpy(), equal_nan=True)).sum())
+        df[name] = metrics[name]
+
+    write_complete_stats(df, output or path)
+    print(f"Recomputed {', '.join(metrics.columns)} for {len(df)} rows in {elapsed*1000:.1f} ms "
+          f"({changed} values changed); saved {output or path}")
+    return df
+
+
+def main(argv=None, prog=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=prog, description="Recompute derived metrics on a stored stats table")
+    parser.add_argument('--data', default='mvp_complete_stats.csv', help="complete stats (.csv or Parquet dataset)")
+    parser.add_argument('--output', default=None, help="write here instead of overwriting --data")
+    parser.add_argument('--metrics', nargs='+', choices=sorted(METRICS), default=None,
+                        help=f"metrics to compute (default: {' '.join(STORED_METRICS)})")
+    parser.add_argument('--list', action='store_true', help="show the registered metrics and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, metric in METRICS.items():
+            print(f"  {name:<14} {', '.join(metric.inputs):<32} {metric.description}")
+        return
+
+    recompute(args.data, args.metrics, args.output)
+
+
+if __name__ == "__main__":
+    main()
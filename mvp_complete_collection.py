@@ -1,48 +1,170 @@
-import pandas as pd
-from pymongo import MongoClient
-from datetime import datetime
-
-df = pd.read_csv("mvp_complete_stats.csv")
-
-client = MongoClient("mongodb://localhost:27017")
-db = client["nba_mvp"]
-candidates = db["mvp_candidates"]
-
-docs = []
-
-for _, row in df.iterrows():
-    season_label = row["Season"]
-    start_year = int(season_label.split("-")[0])
-    end_year = start_year + 1
-
-    doc = {
-        "player": row["Player"],
-        "season": {"label": season_label, "start_year": start_year, "end_year": end_year},
-        "voting": {"mvpPoints": float(row["MVP_Points"])},
-        "stats": {
-            "gp": row.get("gp"),
-            "mpg": row.get("mpg"),
-            "pts": row.get("pts"),
-            "reb": row.get("reb"),
-            "ast": row.get("ast"),
-            "stl": row.get("stl"),
-            "blk": row.get("blk"),
-            "fgPct": row.get("fgPct"),
-            "fg3Pct": row.get("fg3Pct"),
-            "ftPct": row.get("ftPct"),
-            "team": {
-                "abbr": row.get("TEAM"),
-                "record": row.get("TEAM_RECORD"),
-                "winPct": row.get("TEAM_WIN_PCT"),
-            },
-            "gameScore": row.get("GAME_SCORE"),
-            "simplePER": row.get("SIMPLE_PER"),
-            "impactScore": row.get("IMPACT_SCORE"),
-        },
-        "flags": {"pastmvpwinner": bool(row["PAST_MVP_WINNER"])},
-    }
-
-    docs.append(doc)
-
-if docs:
-    candidates.insert_many(docs)
+import hashlib
+import json
+import time
+
+from pymongo import ASCENDING, DESCENDING, DeleteMany, MongoClient, UpdateOne
+from mvp_storage import read_complete_stats
+
+# Document path under "stats" -> column in mvp_complete_stats
+STAT_FIELDS = {
+    "gp": "GP",
+    "mpg": "MPG",
+    "pts": "PTS",
+    "reb": "REB",
+    "ast": "AST",
+    "stl": "STL",
+    "blk": "BLK",
+    "fgPct": "FG_PCT",
+    "fg3Pct": "FG3_PCT",
+    "ftPct": "FT_PCT",
+    "gameScore": "GAME_SCORE",
+    "simplePER": "SIMPLE_PER",
+    "impactScore": "IMPACT_SCORE",
+}
+TEAM_FIELDS = {"abbr": "TEAM", "record": "TEAM_RECORD", "winPct": "TEAM_WIN_PCT"}
+
+HASH_FIELD = "contentHash"
+
+
+def content_hash(doc):
+    # Canonical JSON of everything except the hash itself; stable across runs and key order
+    payload = {key: value for key, value in doc.items() if key not in (HASH_FIELD, "_id")}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def _column(df, name):
+    # Plain Python values with NaN/NA -> None, converted once per column instead of per row
+    if name not in df.columns:
+        return [None] * len(df)
+    column = df[name].astype(object)
+    return column.where(df[name].notna(), None).tolist()
+
+
+def build_documents(df):
+    labels = df["Season"].astype(str)
+    start_years = labels.str[:4].astype(int).tolist()
+    players = _column(df, "Player")
+    mvp_points = df["MVP_Points"].astype(float).tolist()
+    past_winner = df["PAST_MVP_WINNER"].astype(bool).tolist()
+    stats = {field: _column(df, column) for field, column in STAT_FIELDS.items()}
+    team = {field: _column(df, column) for field, column in TEAM_FIELDS.items()}
+
+    docs = []
+    for i, (player, label, start_year) in enumerate(zip(players, labels.tolist(), start_years)):
+        doc_stats = {field: values[i] for field, values in stats.items()}
+        doc_stats["team"] = {field: values[i] for field, values in team.items()}
+        docs.append({
+            "player": player,
+            "season": {"label": label, "start_year": start_year, "end_year": start_year + 1},
+            "voting": {"mvpPoints": mvp_points[i]},
+            "stats": doc_stats,
+            "flags": {"pastmvpwinner": past_winner[i]},
+        })
+        docs[-1][HASH_FIELD] = content_hash(docs[-1])
+    return docs
+
+
+def iter_document_chunks(df, chunk_size=500):
+    for start in range(0, len(df), chunk_size):
+        yield build_documents(df.iloc[start:start + chunk_size])
+
+
+def dedupe_candidates(collection):
+    # The old insert_many loader appended a full copy of every row on each run.
+    # Keep the newest document per (player, season.label) -- ObjectIds sort by
+    # insertion time -- so the unique index below can be built on existing data
+    pipeline = [
+        {"$sort": {"_id": DESCENDING}},
+        {"$group": {
+            "_id": {"player": "$player", "label": "$season.label"},
+            "ids": {"$push": "$_id"},
+            "count": {"$sum": 1},
+        }},
+        {"$match": {"count": {"$gt": 1}}},
+    ]
+    stale = []
+    for group in collection.aggregate(pipeline, allowDiskUse=True):
+        stale.extend(group["ids"][1:])
+
+    removed = 0
+    for start in range(0, len(stale), 1000):
+        result = collection.bulk_write([DeleteMany({"_id": {"$in": stale[start:start + 1000]}})], ordered=False)
+        removed += result.deleted_count
+    if removed:
+        print(f"Removed {removed} duplicate documents left by earlier loads")
+    return removed
+
+
+def ensure_indexes(collection):
+    # (player, season.label) is the upsert key, so it must be unique; existing
+    # duplicates are removed first or the index build fails with DuplicateKeyError
+    dedupe_candidates(collection)
+    collection.create_index([("player", ASCENDING), ("season.label", ASCENDING)], unique=True)
+    collection.create_index([("season.label", ASCENDING)])
+    collection.create_index([("season.start_year", ASCENDING)])
+    collection.create_index([("voting.mvpPoints", DESCENDING)])
+
+
+def stored_hashes(collection, docs):
+    # Hashes already in Mongo for this chunk's keys, fetched with one projected query
+    players = list({doc["player"] for doc in docs})
+    labels = list({doc["season"]["label"] for doc in docs})
+    cursor = collection.find(
+        {"player": {"$in": players}, "season.label": {"$in": labels}},
+        {"_id": 0, "player": 1, "season.label": 1, HASH_FIELD: 1},
+    )
+    return {(doc["player"], doc["season"]["label"]): doc.get(HASH_FIELD) for doc in cursor}
+
+
+def upsert_candidates(collection, df, chunk_size=500):
+    # Idempotent and incremental: only documents whose content hash is new or
+    # different from the stored one are written
+    ensure_indexes(collection)
+    totals = {"documents": 0, "upserted": 0, "modified": 0, "unchanged": 0}
+    start = time.perf_counter()
+
+    for docs in iter_document_chunks(df, chunk_size):
+        known = stored_hashes(collection, docs)
+        changed = [doc for doc in docs
+                   if known.get((doc["player"], doc["season"]["label"])) != doc[HASH_FIELD]]
+        totals["documents"] += len(docs)
+        totals["unchanged"] += len(docs) - len(changed)
+        if not changed:
+            continue
+
+        operations = [
+            UpdateOne({"player": doc["player"], "season.label": doc["season"]["label"]},
+                      {"$set": doc}, upsert=True)
+            for doc in changed
+        ]
+        result = collection.bulk_write(operations, ordered=False)
+        totals["upserted"] += result.upserted_count
+        totals["modified"] += result.modified_count
+
+    totals["seconds"] = time.perf_counter() - start
+    rate = totals["documents"] / totals["seconds"] if totals["seconds"] > 0 else float("inf")
+    print(f"Processed {totals['documents']} documents in {totals['seconds']:.2f}s ({rate:,.0f} docs/s): "
+          f"{totals['upserted']} inserted, {totals['modified']} updated, "
+          f"{totals['unchanged']} unchanged (skipped)")
+    return totals
+
+
+def main(argv=None, prog=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=prog, description="Load complete stats into nba_mvp.mvp_candidates")
+    parser.add_argument("--source", default="mvp_complete_stats.csv", help="complete stats (.csv or Parquet dataset)")
+    parser.add_argument("--uri", default="mongodb://localhost:27017")
+    args = parser.parse_args(argv)
+
+    df = read_complete_stats(args.source)
+
+    client = MongoClient(args.uri)
+    db = client["nba_mvp"]
+    candidates = db["mvp_candidates"]
+
+    upsert_candidates(candidates, df)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Season-level MVP features shared by the stats collector and the analyzer
+import pandas as pd
+
+
+def season_start_year(seasons):
+    # "1999-00" -> 1999, vectorized over a Series of season labels
+    return seasons.astype(str).str[:4].astype(int)
+
+
+def flag_season_winners(df, season_col='Season', points_col='MVP_Points'):
+    # Top vote-getter(s) of each season; ties are all flagged like the old per-season loop
+    return df[points_col] == df.groupby(season_col)[points_col].transform('max')
+
+
+def derive_season_features(df, season_col='Season', points_col='MVP_Points'):
+    # Per-season voting columns from one groupby: the season's points are grouped once
+    # and every column below is a transform/rank over that grouping
+    points = df[points_col]
+    by_season = points.groupby(df[season_col])
+    leader = by_season.transform('max')
+    rank = by_season.rank(method='first', ascending=False)
+
+    return df.assign(
+        MVP_WINNER=points == leader,
+        # method='first' breaks ties by row order, matching nlargest(3) in the old loop
+        TOP_3=rank <= 3,
+        SEASON_RANK=rank.astype('Int64'),
+        # Share of all points given to that season's listed candidates
+        VOTE_SHARE=points / by_season.transform('sum'),
+        POINTS_BEHIND_LEADER=leader - points,
+    )
+
+
+def season_winners(df, season_col='Season', points_col='MVP_Points', player_col='Player'):
+    winners = df.loc[flag_season_winners(df, season_col, points_col), [season_col, player_col]]
+    winners = winners.assign(START_YEAR=season_start_year(winners[season_col]))
+    return winners.sort_values('START_YEAR').reset_index(drop=True)
+
+
+def past_winner_flags(df, season_col='Season', points_col='MVP_Points', player_col='Player'):
+    # True when the player won in any strictly earlier season of df
+    won = pd.DataFrame({
+        'player': df[player_col].to_numpy(),
+        'year': season_start_year(df[season_col]).to_numpy(),
+        'won': flag_season_winners(df, season_col, points_col).to_numpy(),
+    })
+    per_season = won.groupby(['player', 'year'], sort=True)['won'].max().astype(int)
+
+    # One ordered pass: wins so far minus this season's win = wins before this season
+    wins_to_date = per_season.groupby(level='player').cumsum()
+    won_before = (wins_to_date - per_season) > 0
+
+    flags = won_before.reindex(pd.MultiIndex.from_frame(won[['player', 'year']]))
+    return pd.Series(flags.to_numpy(dtype=bool), index=df.index, name='PAST_MVP_WINNER')
+
+
+def past_winner_lookup(df, season_col='Season', points_col='MVP_Points', player_col='Player'):
+    flags = past_winner_flags(df, season_col, points_col, player_col)
+    return dict(zip(zip(df[player_col], df[season_col]), flags))
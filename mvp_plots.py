@@ -0,0 +1,221 @@
+# Figure rendering for MVPAnalyzer: process pool on the Agg backend, skipped when cached
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Bump when a render function changes so cached figures are redrawn
+RENDER_VERSION = 1
+
+FINAL_STYLE = {'dpi': 300, 'bbox_inches': 'tight', 'seaborn_style': 'whitegrid'}
+DRAFT_STYLE = {'dpi': 100, 'bbox_inches': None, 'seaborn_style': 'whitegrid'}
+
+MANIFEST_NAME = '.plot_manifest.json'
+
+
+def _setup_backend(seaborn_style='whitegrid'):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    sns.set_style(seaborn_style)
+    plt.rcParams['figure.figsize'] = (12, 8)
+    return plt
+
+
+def _save(plt, path, style):
+    plt.savefig(path, dpi=style['dpi'], bbox_inches=style['bbox_inches'])
+    plt.close('all')
+
+
+def render_team_success(data, path, style):
+    plt = _setup_backend(style['seaborn_style'])
+    corr = data['corr']
+    plt.figure(figsize=(12, 8))
+
+    # Plot winners vs non-winners
+    plt.scatter(data['others_win_pct'], data['others_points'],
+               alpha=0.5, s=50, c='lightblue', label='MVP Candidates', edgecolors='black')
+    plt.scatter(data['winners_win_pct'], data['winners_points'],
+               alpha=0.9, s=200, c='gold', label='MVP Winners', edgecolors='black', linewidths=2)
+
+    plt.xlabel('Team Win Percentage', fontsize=14, fontweight='bold')
+    plt.ylabel('MVP Voting Points', fontsize=14, fontweight='bold')
+    plt.title('Team Success vs MVP Voting Points (2000-2025)', fontsize=16, fontweight='bold')
+    plt.legend(fontsize=12)
+    plt.grid(True, alpha=0.3)
+
+    # Add correlation text
+    plt.text(0.02, 0.98, f'Correlation: {corr:.3f}',
+            transform=plt.gca().transAxes, fontsize=12,
+            verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+
+    plt.tight_layout()
+    _save(plt, path, style)
+
+
+def render_historical_trends(data, path, style):
+    plt = _setup_backend(style['seaborn_style'])
+    fig, axes = plt.subplots(2, 3, figsize=(16, 10))
+
+    for idx, (stat, title) in enumerate(data['stats']):
+        ax = axes[idx // 3, idx % 3]
+
+        colors = ['#3498db', '#e74c3c']
+        bars = ax.bar(['2000-2009', '2010-2024'], [data['early'][stat], data['modern'][stat]],
+                     color=colors, edgecolor='black', linewidth=2)
+
+        # Add value labels on bars
+        for bar in bars:
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                   f'{height:.1f}',
+                   ha='center', va='bottom', fontsize=11, fontweight='bold')
+
+        ax.set_title(title, fontsize=12, fontweight='bold')
+        ax.grid(True, alpha=0.3, axis='y')
+
+    plt.suptitle('Historical Trends in MVP Winners: Early vs Modern Era',
+                fontsize=16, fontweight='bold')
+    plt.tight_layout()
+    _save(plt, path, style)
+
+
+def render_past_winner_advantage(data, path, style):
+    plt = _setup_backend(style['seaborn_style'])
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+
+    # Win rate comparison
+    categories = ['Past MVP\nWinners', 'First-Time\nFinalists']
+    colors = ['#f39c12', '#95a5a6']
+
+    bars = axes[0].bar(categories, data['win_rates'], color=colors, edgecolor='black', linewidth=2)
+    axes[0].set_ylabel('MVP Win Rate (%)', fontsize=12, fontweight='bold')
+    axes[0].set_title('MVP Win Rate by Previous Winner Status', fontsize=14, fontweight='bold')
+    axes[0].grid(True, alpha=0.3, axis='y')
+
+    # Add percentage labels
+    for bar in bars:
+        height = bar.get_height()
+        axes[0].text(bar.get_x() + bar.get_width()/2., height,
+                    f'{height:.1f}%',
+                    ha='center', va='bottom', fontsize=12, fontweight='bold')
+
+    # Multiple winners bar chart
+    players, counts = data['multiple_players'], data['multiple_counts']
+    if players:
+        axes[1].barh(range(len(players)), counts, color='#2ecc71', edgecolor='black', linewidth=2)
+        axes[1].set_yticks(range(len(players)))
+        axes[1].set_yticklabels(players, fontsize=10)
+        axes[1].set_xlabel('Number of MVP Awards', fontsize=12, fontweight='bold')
+        axes[1].set_title('Multiple-Time MVP Winners', fontsize=14, fontweight='bold')
+        axes[1].grid(True, alpha=0.3, axis='x')
+        axes[1].invert_yaxis()
+
+    plt.tight_layout()
+    _save(plt, path, style)
+
+
+def render_thresholds(data, path, style):
+    plt = _setup_backend(style['seaborn_style'])
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+
+    # Box plots for key stats
+    for (stat, title), ax in zip(data['stats'], axes.flat):
+        groups = data['groups'][stat]
+        bp = ax.boxplot([groups['winners'], groups['top3'], groups['others']],
+                       patch_artist=True, showmeans=True)
+        # Set separately: boxplot's labels= was renamed tick_labels= in matplotlib 3.9
+        ax.set_xticklabels(['MVP\nWinners', 'Top 3\nFinishers', 'Other\nCandidates'])
+
+        colors = ['#FFD700', '#C0C0C0', '#CD7F32']
+        for patch, color in zip(bp['boxes'], colors):
+            patch.set_facecolor(color)
+            patch.set_edgecolor('black')
+            patch.set_linewidth(2)
+
+        ax.set_ylabel(title, fontsize=11, fontweight='bold')
+        ax.set_title(f'{title} Distribution', fontsize=12, fontweight='bold')
+        ax.grid(True, alpha=0.3, axis='y')
+
+    plt.suptitle('MVP Candidate Statistical Thresholds (2000-2025)',
+                fontsize=16, fontweight='bold')
+    plt.tight_layout()
+    _save(plt, path, style)
+
+
+RENDERERS = {
+    'team_success': render_team_success,
+    'historical_trends': render_historical_trends,
+    'past_winner_advantage': render_past_winner_advantage,
+    'thresholds': render_thresholds,
+}
+
+
+def plot_key(kind, data, style):
+    # The figure is a pure function of (renderer, data slice, style), so this names its content
+    payload = json.dumps({'version': RENDER_VERSION, 'kind': kind, 'style': style, 'data': data},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def load_manifest(plot_dir):
+    path = os.path.join(plot_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(plot_dir, manifest):
+    path = os.path.join(plot_dir, MANIFEST_NAME)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _render_job(kind, data, path, style):
+    RENDERERS[kind](data, path, style)
+    return path
+
+
+def render_plots(jobs, plot_dir, draft=False, workers=None, force=False):
+    # jobs: (kind, filename, data) with data as plain JSON-able lists/dicts.
+    # Returns [(path, rendered)] in job order; rendered is False for cache hits.
+    style = DRAFT_STYLE if draft else FINAL_STYLE
+    manifest = load_manifest(plot_dir)
+
+    results = []
+    pending = []
+    for kind, filename, data in jobs:
+        path = os.path.join(plot_dir, filename)
+        key = plot_key(kind, data, style)
+        if not force and manifest.get(filename) == key and os.path.exists(path):
+            results.append((path, False))
+            continue
+        results.append((path, True))
+        pending.append((kind, data, path, style, filename, key))
+
+    if pending:
+        workers = workers or min(len(pending), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_render_job, kind, data, path, job_style)
+                           for kind, data, path, job_style, _, _ in pending]
+                for future in futures:
+                    future.result()
+        else:
+            for kind, data, path, job_style, _, _ in pending:
+                _render_job(kind, data, path, job_style)
+
+        for *_, filename, key in pending:
+            manifest[filename] = key
+        save_manifest(plot_dir, manifest)
+
+    return results
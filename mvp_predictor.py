@@ -0,0 +1,181 @@
+# MVP vote-share model: ridge regression on season stats, ranked within each season
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from mvp_features import derive_season_features
+from mvp_storage import read_complete_stats
+
+
+FEATURES = ['PTS', 'REB', 'AST', 'STL', 'BLK', 'FG_PCT', 'FG3_PCT', 'FT_PCT', 'GAME_SCORE',
+            'SIMPLE_PER', 'IMPACT_SCORE', 'TEAM_WIN_PCT', 'PAST_MVP_WINNER']
+TARGET = 'VOTE_SHARE'
+MODEL_VERSION = 1
+
+
+def feature_matrix(df, features=FEATURES):
+    # float64 (rows x features); booleans become 0/1, missing values stay NaN until fit/predict
+    return np.column_stack([pd.to_numeric(df[name], errors='coerce').astype(float).to_numpy()
+                            for name in features])
+
+
+def fit_ridge(X, y, alpha=1.0):
+    # Closed-form ridge on standardized columns; the intercept is left unpenalized
+    mean = np.nanmean(X, axis=0)
+    X = np.where(np.isnan(X), mean, X)
+    scale = X.std(axis=0)
+    scale[scale == 0] = 1.0
+    Z = (X - mean) / scale
+
+    y_mean = y.mean()
+    coef = np.linalg.solve(Z.T @ Z + alpha * np.eye(Z.shape[1]), Z.T @ (y - y_mean))
+    return {'mean': mean, 'scale': scale, 'coef': coef, 'intercept': y_mean}
+
+
+def predict_ridge(params, X):
+    X = np.where(np.isnan(X), params['mean'], X)
+    return ((X - params['mean']) / params['scale']) @ params['coef'] + params['intercept']
+
+
+def rank_within_seasons(seasons, scores):
+    # 1 = highest predicted share in its season
+    return pd.Series(scores).groupby(np.asarray(seasons)).rank(method='first', ascending=False).astype(int).to_numpy()
+
+
+class MVPPredictor:
+
+    def __init__(self, alpha=1.0, features=None):
+        self.alpha = alpha
+        self.features = list(features or FEATURES)
+        self.params = None
+
+    def fit(self, df):
+        df = derive_season_features(df)
+        self.params = fit_ridge(feature_matrix(df, self.features), df[TARGET].to_numpy(dtype=float), self.alpha)
+        return self
+
+    def predict(self, df):
+        if self.params is None:
+            raise RuntimeError("MVPPredictor is not fitted; call fit() or load() first")
+        return predict_ridge(self.params, feature_matrix(df, self.features))
+
+    def score(self, df):
+        # Whole candidate pool (any number of seasons) in one matrix product
+        shares = self.predict(df)
+        scored = df[['Player', 'Season']].copy()
+        scored['PREDICTED_SHARE'] = shares
+        scored['PREDICTED_RANK'] = rank_within_seasons(df['Season'], shares)
+        return scored.sort_values(['Season', 'PREDICTED_RANK']).reset_index(drop=True)
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': MODEL_VERSION,
+                'alpha': self.alpha,
+                'features': self.features,
+                'params': {key: np.asarray(value).tolist() for key, value in self.params.items()},
+            }, f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        if payload.get('version') != MODEL_VERSION:
+            raise ValueError(f"{path}: model version {payload.get('version')} != {MODEL_VERSION}")
+        model = cls(payload['alpha'], payload['features'])
+        model.params = {key: np.asarray(value, dtype=float) for key, value in payload['params'].items()}
+        return model
+
+
+def fold_metrics(shares, actual_shares, winners):
+    # Plain-array scoring of one held-out season: predicted #1 index, top-1/top-3 hits, share MAE
+    order = np.argsort(-shares, kind='stable')
+    return {
+        'predicted_index': int(order[0]),
+        'TOP1_HIT': bool(winners[order[:1]].any()),
+        'TOP3_HIT': bool(winners[order[:3]].any()),
+        'SHARE_MAE': float(np.abs(shares - actual_shares).mean()),
+    }
+
+
+def season_report(season_df, shares):
+    # Did the predicted #1 / top 3 contain the actual winner?
+    winners = season_df['MVP_WINNER'].to_numpy()
+    metrics = fold_metrics(shares, season_df[TARGET].to_numpy(dtype=float), winners)
+    return {
+        'Season': season_df['Season'].iloc[0],
+        'Winner': ', '.join(season_df.loc[winners, 'Player']),
+        'Predicted': season_df['Player'].iloc[metrics.pop('predicted_index')],
+        **metrics,
+    }
+
+
+def leave_one_season_out(df, alpha=1.0, features=None):
+    # Train on every other season, score the held-out one
+    features = list(features or FEATURES)
+    df = derive_season_features(df).reset_index(drop=True)
+    X = feature_matrix(df, features)
+    y = df[TARGET].to_numpy(dtype=float)
+    seasons = df['Season'].to_numpy()
+
+    rows = []
+    for season in pd.unique(seasons):
+        held_out = seasons == season
+        params = fit_ridge(X[~held_out], y[~held_out], alpha)
+        rows.append(season_report(df[held_out], predict_ridge(params, X[held_out])))
+    return pd.DataFrame(rows)
+
+
+def print_cv_summary(results, alpha):
+    print(f"Leave-one-season-out CV (alpha={alpha:g}, {len(results)} seasons)")
+    print(f"  Top-1 accuracy: {results['TOP1_HIT'].mean()*100:.1f}%")
+    print(f"  Top-3 accuracy: {results['TOP3_HIT'].mean()*100:.1f}%")
+    print(f"  Vote share MAE: {results['SHARE_MAE'].mean():.3f}")
+    misses = results[~results['TOP1_HIT']]
+    if len(misses) > 0:
+        print("\n  Missed seasons:")
+        for _, row in misses.iterrows():
+            print(f"    {row['Season']}: predicted {row['Predicted']}, actual {row['Winner']}")
+
+
+def main(argv=None, prog=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=prog, description="Train, validate and apply the MVP vote-share model")
+    parser.add_argument('--data', default='mvp_complete_stats.csv', help="training data (.csv or Parquet dataset)")
+    parser.add_argument('--model', default='mvp_model.json', help="where the fitted model is saved/loaded")
+    parser.add_argument('--alpha', type=float, default=1.0, help="ridge penalty")
+    parser.add_argument('--cv', action='store_true', help="report leave-one-season-out accuracy before fitting")
+    parser.add_argument('--candidates', help="score this pool with the saved model instead of training")
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.candidates:
+        model = MVPPredictor.load(args.model)
+        pool = read_complete_stats(args.candidates)
+        start = time.perf_counter()
+        scored = model.score(pool)
+        elapsed = time.perf_counter() - start
+        print(f"Scored {len(scored)} candidates in {elapsed*1000:.1f} ms\n")
+        for season, season_scores in scored.groupby('Season', sort=True):
+            print(f"{season} predicted MVP race:")
+            for _, row in season_scores.head(args.top).iterrows():
+                print(f"  {row['PREDICTED_RANK']:>2}. {row['Player']:<28} share {row['PREDICTED_SHARE']:.3f}")
+        return
+
+    df = read_complete_stats(args.data)
+    if args.cv:
+        print_cv_summary(leave_one_season_out(df, args.alpha), args.alpha)
+        print()
+
+    model = MVPPredictor(args.alpha).fit(df)
+    model.save(args.model)
+    print(f"Trained on {len(df)} candidates from {df['Season'].nunique()} seasons; saved {args.model}")
+    for name, weight in sorted(zip(model.features, model.params['coef']), key=lambda item: -abs(item[1])):
+        print(f"  {name:<16} {weight:+.4f}")
+
+
+if __name__ == "__main__":
+    main()
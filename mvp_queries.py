@@ -0,0 +1,322 @@
+# Analyzer questions answered either in pandas or as server-side MongoDB aggregations
+import pandas as pd
+
+from mvp_features import derive_season_features, flag_season_winners, season_start_year
+
+
+# Analyzer column -> document path in nba_mvp.mvp_candidates (see mvp_complete_collection)
+COLUMN_PATHS = {
+    'Player': 'player',
+    'Season': 'season.label',
+    'MVP_Points': 'voting.mvpPoints',
+    'GP': 'stats.gp',
+    'MPG': 'stats.mpg',
+    'PTS': 'stats.pts',
+    'REB': 'stats.reb',
+    'AST': 'stats.ast',
+    'STL': 'stats.stl',
+    'BLK': 'stats.blk',
+    'FG_PCT': 'stats.fgPct',
+    'FG3_PCT': 'stats.fg3Pct',
+    'FT_PCT': 'stats.ftPct',
+    'TEAM': 'stats.team.abbr',
+    'TEAM_RECORD': 'stats.team.record',
+    'TEAM_WIN_PCT': 'stats.team.winPct',
+    'GAME_SCORE': 'stats.gameScore',
+    'SIMPLE_PER': 'stats.simplePER',
+    'IMPACT_SCORE': 'stats.impactScore',
+    'PAST_MVP_WINNER': 'flags.pastmvpwinner',
+}
+
+ERA_SPLIT_YEAR = 2010
+# Lower bound of each team win% bucket, checked from the top down
+WIN_PCT_BUCKETS = [('elite', 70), ('good', 60), ('average', None)]
+
+
+class FrameMVPQueries:
+
+    def __init__(self, df):
+        self.df = df
+        self._is_winner = flag_season_winners(df)
+        self._winners = df[self._is_winner]
+
+    def overview(self):
+        return pd.Series({'candidates': len(self.df), 'first_season': self.df['Season'].min(),
+                          'last_season': self.df['Season'].max()})
+
+    def candidates_frame(self, columns):
+        return self.df[list(columns)].copy()
+
+    def season_winners(self):
+        winners = self._winners[['Season', 'Player', 'MVP_Points']]
+        return winners.sort_values('Season', kind='stable').reset_index(drop=True)
+
+    def _season_ranks(self):
+        # Points descending, ties broken by player name like MongoMVPQueries._ranked_stages
+        by_player = self.df[['Season', 'Player', 'MVP_Points']].sort_values('Player', kind='stable')
+        return derive_season_features(by_player)['SEASON_RANK'].reindex(self.df.index)
+
+    def top_n_per_season(self, n=3):
+        ranked = self.df[['Season', 'Player', 'MVP_Points']].assign(SEASON_RANK=self._season_ranks())
+        top = ranked[ranked['SEASON_RANK'] <= n].rename(columns={'SEASON_RANK': 'RANK'})
+        top = top.sort_values(['Season', 'RANK'])[['Season', 'Player', 'MVP_Points', 'RANK']]
+        return top.astype({'RANK': int}).reset_index(drop=True)
+
+    def top_n_vs_rest(self, stats, n=3):
+        group = (self._season_ranks() <= n).map({True: 'top', False: 'rest'})
+        stats = [stat for stat in stats if stat in self.df.columns]
+        return self.df[stats].groupby(group).mean().reindex(['top', 'rest']).rename_axis(None)
+
+    def correlation(self, x, y):
+        return self.df[x].corr(self.df[y])
+
+    def past_winner_rates(self):
+        # Candidate count and MVP win rate for past winners vs first-timers
+        flag = self.df['PAST_MVP_WINNER']
+        rows = {}
+        for group, value in (('past', True), ('first', False)):
+            won = self._is_winner[flag == value]
+            rows[group] = {'count': len(won), 'win_rate': won.mean()}
+        return pd.DataFrame(rows).T
+
+    def multiple_winners(self, min_wins=2):
+        counts = self._winners.groupby('Player').size()
+        counts = counts[counts >= min_wins]
+        return counts.sort_values(ascending=False)
+
+    def winner_quantiles(self, stats, quantiles):
+        return self._winners[list(stats)].quantile(list(quantiles)).T
+
+    def past_winner_share(self):
+        # Fraction of season winners who had already won an MVP
+        return self._winners['PAST_MVP_WINNER'].mean()
+
+    def winner_thresholds(self, stats):
+        winners = self._winners
+        return pd.DataFrame({
+            stat: {
+                'min': winners[stat].min(),
+                'max': winners[stat].max(),
+                'mean': winners[stat].mean(),
+                'median': winners[stat].median()
+            } for stat in stats if stat in winners.columns
+        }).T
+
+    def thresholds_by_era(self, stats, split_year=ERA_SPLIT_YEAR):
+        winners = self._winners
+        era = (season_start_year(winners['Season']) >= split_year).map({False: 'early', True: 'modern'})
+        by_era = winners.groupby(era)[list(stats)].mean()
+        by_era['count'] = winners.groupby(era).size()
+        return by_era.reindex(['early', 'modern']).rename_axis(None)
+
+    def win_pct_buckets(self):
+        win_pct = self._winners['TEAM_WIN_PCT']
+        counts = {}
+        upper = None
+        for bucket, lower in WIN_PCT_BUCKETS:
+            mask = win_pct.notna()
+            if lower is not None:
+                mask &= win_pct >= lower
+            if upper is not None:
+                mask &= win_pct < upper
+            counts[bucket] = int(mask.sum())
+            upper = lower
+        return pd.Series(counts)
+
+
+class MongoMVPQueries:
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    @classmethod
+    def from_uri(cls, uri='mongodb://localhost:27017', database='nba_mvp', collection='mvp_candidates'):
+        from pymongo import MongoClient
+
+        return cls(MongoClient(uri)[database][collection])
+
+    def _winner_stages(self):
+        # Top vote-getter(s) per season; ties all survive, like flag_season_winners
+        return [
+            {'$group': {
+                '_id': '$season.label',
+                'maxPoints': {'$max': '$voting.mvpPoints'},
+                'docs': {'$push': '$$ROOT'},
+            }},
+            {'$unwind': '$docs'},
+            {'$match': {'$expr': {'$eq': ['$docs.voting.mvpPoints', '$maxPoints']}}},
+            {'$replaceRoot': {'newRoot': '$docs'}},
+        ]
+
+    def _ranked_stages(self, fields):
+        # Each season's candidates pushed in finishing order; index 0 is the winner.
+        # Tied points fall back to player name, as in FrameMVPQueries._season_ranks
+        return [
+            {'$sort': {'season.label': 1, 'voting.mvpPoints': -1, 'player': 1}},
+            {'$group': {'_id': '$season.label', 'candidates': {'$push': fields}}},
+        ]
+
+    def overview(self):
+        pipeline = [{'$group': {'_id': None, 'candidates': {'$sum': 1},
+                                'first_season': {'$min': '$season.label'},
+                                'last_season': {'$max': '$season.label'}}}]
+        result = next(iter(self.collection.aggregate(pipeline)), None)
+        if result is None:
+            return pd.Series({'candidates': 0, 'first_season': None, 'last_season': None})
+        return pd.Series({key: result[key] for key in ('candidates', 'first_season', 'last_season')})
+
+    def candidates_frame(self, columns):
+        # Projected rows for callers that need per-candidate data (e.g. plots)
+        projection = {'_id': 0}
+        projection.update({COLUMN_PATHS[column]: 1 for column in columns})
+        rows = []
+        for doc in self.collection.find({}, projection).sort([('season.start_year', 1), ('voting.mvpPoints', -1)]):
+            row = {}
+            for column in columns:
+                value = doc
+                for key in COLUMN_PATHS[column].split('.'):
+                    value = value.get(key) if isinstance(value, dict) else None
+                row[column] = value
+            rows.append(row)
+        return pd.DataFrame(rows, columns=list(columns))
+
+    def season_winners(self):
+        pipeline = self._winner_stages() + [
+            {'$sort': {'season.label': 1}},
+            {'$project': {'_id': 0, 'Season': '$season.label', 'Player': '$player',
+                          'MVP_Points': '$voting.mvpPoints'}},
+        ]
+        return pd.DataFrame(list(self.collection.aggregate(pipeline)), columns=['Season', 'Player', 'MVP_Points'])
+
+    def top_n_per_season(self, n=3):
+        pipeline = self._ranked_stages({'Player': '$player', 'MVP_Points': '$voting.mvpPoints'}) + [
+            {'$project': {'candidates': {'$slice': ['$candidates', n]}}},
+            {'$unwind': {'path': '$candidates', 'includeArrayIndex': 'index'}},
+            {'$sort': {'_id': 1, 'index': 1}},
+            {'$project': {'_id': 0, 'Season': '$_id', 'Player': '$candidates.Player',
+                          'MVP_Points': '$candidates.MVP_Points', 'index': 1}},
+        ]
+        df = pd.DataFrame(list(self.collection.aggregate(pipeline)))
+        if df.empty:
+            return pd.DataFrame(columns=['Season', 'Player', 'MVP_Points', 'RANK'])
+        df['RANK'] = df.pop('index').astype(int) + 1
+        return df[['Season', 'Player', 'MVP_Points', 'RANK']]
+
+    def top_n_vs_rest(self, stats, n=3):
+        pipeline = self._ranked_stages({stat: f"${COLUMN_PATHS[stat]}" for stat in stats}) + [
+            {'$unwind': {'path': '$candidates', 'includeArrayIndex': 'index'}},
+            {'$group': {'_id': {'$cond': [{'$lt': ['$index', n]}, 'top', 'rest']},
+                        **{stat: {'$avg': f"$candidates.{stat}"} for stat in stats}}},
+        ]
+        rows = list(self.collection.aggregate(pipeline))
+        by_group = pd.DataFrame(rows).set_index('_id') if rows else pd.DataFrame(columns=list(stats))
+        return by_group[list(stats)].reindex(['top', 'rest']).rename_axis(None)
+
+    def correlation(self, x, y):
+        # Pearson r from server-side sums over rows where both values are numeric
+        x_path, y_path = f"${COLUMN_PATHS[x]}", f"${COLUMN_PATHS[y]}"
+        pipeline = [
+            {'$match': {COLUMN_PATHS[x]: {'$type': 'number'}, COLUMN_PATHS[y]: {'$type': 'number'}}},
+            {'$group': {'_id': None, 'n': {'$sum': 1},
+                        'sx': {'$sum': x_path}, 'sy': {'$sum': y_path},
+                        'sxx': {'$sum': {'$multiply': [x_path, x_path]}},
+                        'syy': {'$sum': {'$multiply': [y_path, y_path]}},
+                        'sxy': {'$sum': {'$multiply': [x_path, y_path]}}}},
+        ]
+        r = next(iter(self.collection.aggregate(pipeline)), None)
+        if r is None or r['n'] < 2:
+            return float('nan')
+        cov = r['sxy'] - r['sx'] * r['sy'] / r['n']
+        var_x = r['sxx'] - r['sx'] ** 2 / r['n']
+        var_y = r['syy'] - r['sy'] ** 2 / r['n']
+        if var_x <= 0 or var_y <= 0:
+            return float('nan')
+        return cov / (var_x * var_y) ** 0.5
+
+    def past_winner_rates(self):
+        flag = COLUMN_PATHS['PAST_MVP_WINNER']
+        pipeline = [
+            {'$group': {'_id': '$season.label', 'maxPoints': {'$max': '$voting.mvpPoints'},
+                        'docs': {'$push': {'past': f"${flag}", 'points': '$voting.mvpPoints'}}}},
+            {'$unwind': '$docs'},
+            {'$match': {'docs.past': {'$type': 'bool'}}},
+            {'$group': {'_id': '$docs.past', 'count': {'$sum': 1},
+                        'win_rate': {'$avg': {'$cond': [{'$eq': ['$docs.points', '$maxPoints']}, 1, 0]}}}},
+        ]
+        rows = {row['_id']: row for row in self.collection.aggregate(pipeline)}
+        return pd.DataFrame({
+            group: {'count': rows[value]['count'] if value in rows else 0,
+                    'win_rate': rows[value]['win_rate'] if value in rows else float('nan')}
+            for group, value in (('past', True), ('first', False))
+        }).T
+
+    def multiple_winners(self, min_wins=2):
+        pipeline = self._winner_stages() + [
+            {'$group': {'_id': '$player', 'count': {'$sum': 1}}},
+            {'$match': {'count': {'$gte': min_wins}}},
+            {'$sort': {'count': -1, '_id': 1}},
+        ]
+        rows = list(self.collection.aggregate(pipeline))
+        return pd.Series({row['_id']: row['count'] for row in rows}, dtype=int).rename_axis('Player')
+
+    def winner_quantiles(self, stats, quantiles):
+        # One value per season per stat, so the quantiles are taken client-side
+        group = {'_id': None}
+        group.update({stat: {'$push': f"${COLUMN_PATHS[stat]}"} for stat in stats})
+        result = next(iter(self.collection.aggregate(self._winner_stages() + [{'$group': group}])), None)
+        if result is None:
+            return pd.DataFrame(index=list(stats), columns=list(quantiles), dtype=float)
+        return pd.DataFrame({
+            stat: pd.Series(result[stat], dtype=float).quantile(list(quantiles)) for stat in stats
+        }).T
+
+    def past_winner_share(self):
+        path = f"${COLUMN_PATHS['PAST_MVP_WINNER']}"
+        pipeline = self._winner_stages() + [
+            {'$match': {COLUMN_PATHS['PAST_MVP_WINNER']: {'$type': 'bool'}}},
+            {'$group': {'_id': None, 'share': {'$avg': {'$cond': [path, 1, 0]}}}},
+        ]
+        result = next(iter(self.collection.aggregate(pipeline)), None)
+        return result['share'] if result else float('nan')
+
+    def winner_thresholds(self, stats):
+        group = {'_id': None}
+        for stat in stats:
+            path = f"${COLUMN_PATHS[stat]}"
+            group[f"{stat}__min"] = {'$min': path}
+            group[f"{stat}__max"] = {'$max': path}
+            group[f"{stat}__mean"] = {'$avg': path}
+            # Winners are one per season, so pushing the values for the median stays tiny
+            group[f"{stat}__values"] = {'$push': path}
+        result = next(iter(self.collection.aggregate(self._winner_stages() + [{'$group': group}])), None)
+        if result is None:
+            return pd.DataFrame(columns=['min', 'max', 'mean', 'median'])
+
+        return pd.DataFrame({
+            stat: {
+                'min': result[f"{stat}__min"],
+                'max': result[f"{stat}__max"],
+                'mean': result[f"{stat}__mean"],
+                'median': pd.Series(result[f"{stat}__values"], dtype=float).median()
+            } for stat in stats
+        }).T
+
+    def thresholds_by_era(self, stats, split_year=ERA_SPLIT_YEAR):
+        group = {'_id': {'$cond': [{'$lt': ['$season.start_year', split_year]}, 'early', 'modern']},
+                 'count': {'$sum': 1}}
+        group.update({stat: {'$avg': f"${COLUMN_PATHS[stat]}"} for stat in stats})
+        rows = list(self.collection.aggregate(self._winner_stages() + [{'$group': group}]))
+        by_era = pd.DataFrame(rows).set_index('_id') if rows else pd.DataFrame(columns=list(stats) + ['count'])
+        return by_era[list(stats) + ['count']].reindex(['early', 'modern']).rename_axis(None)
+
+    def win_pct_buckets(self):
+        path = f"${COLUMN_PATHS['TEAM_WIN_PCT']}"
+        branches = [{'case': {'$gte': [path, lower]}, 'then': bucket}
+                    for bucket, lower in WIN_PCT_BUCKETS if lower is not None]
+        default = [bucket for bucket, lower in WIN_PCT_BUCKETS if lower is None][0]
+        pipeline = self._winner_stages() + [
+            {'$match': {COLUMN_PATHS['TEAM_WIN_PCT']: {'$type': 'number'}}},
+            {'$group': {'_id': {'$switch': {'branches': branches, 'default': default}}, 'count': {'$sum': 1}}},
+        ]
+        counts = {row['_id']: row['count'] for row in self.collection.aggregate(pipeline)}
+        return pd.Series({bucket: int(counts.get(bucket, 0)) for bucket, _ in WIN_PCT_BUCKETS})
@@ -1,53 +1,99 @@
 # basketballreference.com MVP Scraper
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
-import time
-import random
+import os
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from award_page_parser import AWARD_TABLES, parse_award_tables, parse_mvp_table
+from driver_pool import USER_AGENT, DriverPool, create_driver
+from mvp_storage import write_award_voting, write_voting_results
+from rate_limiter import TokenBucket
 
 
 class MVPSeleniumScraper:
     
     BASE_URL = "https://www.basketball-reference.com"
+    ENGINES = ('selenium', 'html')
     
-    def __init__(self, start_year: int = 2000, end_year: int = 2025, headless: bool = False):
+    def __init__(self, start_year: int = 2000, end_year: int = 2025, headless: bool = False,
+                 workers: int = 1, base_url: str = None, pages_per_second: float = 0.2,
+                 remote_url: str = None, engine: str = 'selenium', min_points: float = 100):
+        if engine not in self.ENGINES:
+            raise ValueError(f"engine must be one of {self.ENGINES}, got {engine!r}")
+        # 'html' fetches raw pages and parses them with lxml, no browser needed
+        self.engine = engine
+        # Voting rows at or below this many points are dropped
+        self.min_points = min_points
         self.start_year = start_year
         self.end_year = end_year
         self.headless = headless
+        self.workers = workers
+        # base_url can point at a local fixture server; remote_url at a long-lived Selenium server
+        self.base_url = (base_url or self.BASE_URL).rstrip('/')
+        self.remote_url = remote_url
+        # Politeness limit shared by every browser in the pool (~one page per 5 s by default)
+        self.page_limiter = TokenBucket(pages_per_second, capacity=1)
         self.driver = None
+        self.session = None
         
     def setup_driver(self):
-        chrome_options = Options()
+        self.driver = create_driver(self.headless, self.remote_url)
         
-        if self.headless:
-            chrome_options.add_argument('--headless')
+    def award_page_url(self, year: int) -> str:
+        return f"{self.base_url}/awards/awards_{year}.html"
+    
+    def load_page(self, url: str) -> bytes:
+        # http(s) URLs go through a keep-alive session; file:// URLs and plain paths
+        # (saved fixture pages) are read from disk
+        if url.startswith(('http://', 'https://')):
+            if self.session is None:
+                self.session = requests.Session()
+                self.session.headers['User-Agent'] = USER_AGENT
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            return response.content
         
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        path = url[len('file://'):] if url.startswith('file://') else url
+        with open(os.path.expanduser(path), 'rb') as f:
+            return f.read()
+    
+    def get_mvp_voting(self, year: int, driver=None) -> pd.DataFrame:
+
+        print(f"Fetching MVP voting data for {year-1}-{str(year)[-2:]} season...")
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if self.engine == 'html':
+            return self._get_mvp_voting_html(year)
+        return self._get_mvp_voting_selenium(year, driver or self.driver)
+    
+    def _get_mvp_voting_html(self, year: int) -> pd.DataFrame:
         
-    def get_mvp_voting(self, year: int) -> pd.DataFrame:
+        try:
+            df = parse_mvp_table(self.load_page(self.award_page_url(year)), year, self.min_points)
+            
+            if df is None:
+                print(f"  MVP table not found for {year}")
+                return pd.DataFrame()
+            
+            print(f"  Found {len(df)} MVP candidates with >{self.min_points:g} points")
+            return df
+            
+        except Exception as e:
+            print(f"  Error fetching {year}: {e}")
+            return pd.DataFrame()
+    
+    def _get_mvp_voting_selenium(self, year: int, driver) -> pd.DataFrame:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-        url = f"{self.BASE_URL}/awards/awards_{year}.html"
-        print(f"Fetching MVP voting data for {year-1}-{str(year)[-2:]} season...")
+        url = self.award_page_url(year)
         
         try:
-            self.driver.get(url)
+            driver.get(url)
             
             # Wait for table to load
-            wait = WebDriverWait(self.driver, 10)
+            wait = WebDriverWait(driver, 10)
             mvp_table = wait.until(
                 EC.presence_of_element_located((By.ID, "mvp"))
             )
@@ -76,8 +122,8 @@ class MVPSeleniumScraper:
                     except ValueError:
                         points = 0
                     
-                    # Only include players with >100 points
-                    if points > 100 and player_name:
+                    # Only include players above the points threshold
+                    if points > self.min_points and player_name:
                         data.append({
                             'Player': player_name,
                             'Points': points,
@@ -89,7 +135,7 @@ class MVPSeleniumScraper:
                     continue
             
             df = pd.DataFrame(data)
-            print(f"  Found {len(df)} MVP candidates with >100 points")
+            print(f"  Found {len(df)} MVP candidates with >{self.min_points:g} points")
             return df
             
         except TimeoutException:
@@ -99,30 +145,75 @@ class MVPSeleniumScraper:
             print(f"  Error fetching {year}: {e}")
             return pd.DataFrame()
     
-    def scrape_all_data(self) -> pd.DataFrame:
-
-        print(f"\nStarting MVP voting data scrape from {self.start_year} to {self.end_year}")
+    def get_award_voting(self, year: int, driver=None, awards=None) -> pd.DataFrame:
+        # Every award voting table from a single page load, in long format
+        awards = list(awards or AWARD_TABLES)
+        url = self.award_page_url(year)
+        print(f"Fetching award voting data for {year-1}-{str(year)[-2:]} season...")
         
-        self.setup_driver()
+        try:
+            if self.engine == 'html':
+                page = self.load_page(url)
+            else:
+                page = self._rendered_page(driver or self.driver, url, AWARD_TABLES['MVP'])
+                if page is None:
+                    print(f"  Timeout: award tables not found for {year}")
+                    return pd.DataFrame()
+            
+            df = parse_award_tables(page, year, awards, self.min_points)
+            counts = df.groupby('Award').size().reindex(awards, fill_value=0)
+            print("  Found " + ", ".join(f"{award} {count}" for award, count in counts.items()))
+            return df
+            
+        except Exception as e:
+            print(f"  Error fetching {year}: {e}")
+            return pd.DataFrame()
+    
+    def _rendered_page(self, driver, url: str, table_id: str):
+        # Page source once table_id is present, or None on timeout
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+
+        driver.get(url)
+        try:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, table_id)))
+        except TimeoutException:
+            return None
+        # Parse the rendered source in one pass instead of walking WebElements
+        return driver.page_source
+    
+    def _fetch_year(self, pool, year: int, fetch) -> pd.DataFrame:
+        self.page_limiter.acquire()
+        if pool is None:
+            return fetch(year)
+        with pool.acquire() as driver:
+            return fetch(year, driver)
+    
+    def _scrape_years(self, pool, fetch) -> pd.DataFrame:
+        # A caller-owned pool stays open so its browsers can be reused by later runs;
+        # the html engine needs no browsers at all
+        owns_pool = pool is None and self.engine == 'selenium'
+        if owns_pool:
+            pool = DriverPool(self.workers, headless=self.headless, remote_url=self.remote_url)
+        if pool is not None:
+            pool.start()
         all_data = []
+        years = range(self.start_year, self.end_year + 1)
         
         try:
-            for year in range(self.start_year, self.end_year + 1):
-                mvp_df = self.get_mvp_voting(year)
-                
-                if mvp_df.empty:
-                    print(f"  Skipping {year}, no data retrieved")
-                else:
-                    all_data.extend(mvp_df.to_dict('records'))
-                
-                # Random delay between requests
-                delay = random.uniform(3, 7)
-                time.sleep(delay)
+            with ThreadPoolExecutor(max_workers=pool.size if pool is not None else self.workers) as executor:
+                # map() keeps results in year order regardless of which browser finished first
+                for year, year_df in zip(years, executor.map(lambda y: self._fetch_year(pool, y, fetch), years)):
+                    if year_df.empty:
+                        print(f"  Skipping {year}, no data retrieved")
+                    else:
+                        all_data.extend(year_df.to_dict('records'))
             
         finally:
-            print("\nClosing browser...")
-            if self.driver:
-                self.driver.quit()
+            if owns_pool:
+                pool.close()
         
         print("\n" + "=" * 60)
         print("Scraping complete")
@@ -136,21 +227,51 @@ class MVPSeleniumScraper:
             print("\nNo data collected!")
         
         return df
+    
+    def scrape_all_data(self, pool: DriverPool = None) -> pd.DataFrame:
 
+        print(f"\nStarting MVP voting data scrape from {self.start_year} to {self.end_year}")
+        return self._scrape_years(pool, self.get_mvp_voting)
+    
+    def scrape_all_awards(self, pool: DriverPool = None, awards=None) -> pd.DataFrame:
+
+        print(f"\nStarting award voting data scrape from {self.start_year} to {self.end_year}")
+        return self._scrape_years(pool, lambda year, driver=None: self.get_award_voting(year, driver, awards))
 
-def main():
+
+def main(argv=None, prog=None):
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog=prog, description="Scrape MVP voting from basketball-reference award pages")
+    parser.add_argument('--engine', choices=MVPSeleniumScraper.ENGINES, default='selenium')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--base-url', default=None, help="site root, e.g. a local fixture server")
+    parser.add_argument('--min-points', type=float, default=100, help="drop voting rows at or below this")
+    parser.add_argument('--all-awards', action='store_true',
+                        help="extract every award voting table (MVP, ROY, DPOY, 6MOY, MIP, Clutch)")
+    parser.add_argument('--headless', action=argparse.BooleanOptionalAction, default=True,
+                        help="run Chrome without a window (--no-headless to watch the browsers)")
+    parser.add_argument('--remote-url', default=None,
+                        help="Selenium server/Grid to reuse across runs instead of launching local Chrome")
+    args = parser.parse_args(argv)
     
-    scraper = MVPSeleniumScraper(start_year=2000, end_year=2025, headless=False)
+    scraper = MVPSeleniumScraper(start_year=2000, end_year=2025, headless=args.headless,
+                                 workers=args.workers, base_url=args.base_url, engine=args.engine,
+                                 min_points=args.min_points, remote_url=args.remote_url)
     
-    df = scraper.scrape_all_data()
+    df = scraper.scrape_all_awards() if args.all_awards else scraper.scrape_all_data()
     
     if df.empty:
         print("\nNo data was scraped. Please check for errors above.")
         return
     
-    # Save to CSV
-    output_file = 'mvp_voting_results.csv'
-    df.to_csv(output_file, index=False)
+    # Save (CSV export by default; a path without .csv writes a Parquet dataset)
+    if args.all_awards:
+        output_file = 'award_voting_results.csv'
+        write_award_voting(df, output_file)
+    else:
+        output_file = 'mvp_voting_results.csv'
+        write_voting_results(df, output_file)
     print(f"\nData saved to {output_file}")
     
     # Display summary
@@ -0,0 +1,174 @@
+# Typed storage for the pipeline's tables: season-partitioned Parquet, CSV as an export format
+import os
+import shutil
+
+import pandas as pd
+
+
+# Column -> (pandas dtype, pyarrow type name)
+VOTING_RESULTS_SCHEMA = {
+    'Player': ('string', 'string'),
+    'Points': ('float64', 'float64'),
+    'Season': ('string', 'string'),
+    'Year': ('int64', 'int64'),
+}
+
+AWARD_VOTING_SCHEMA = {
+    'Award': ('string', 'string'),
+    'Season': ('string', 'string'),
+    'Year': ('int64', 'int64'),
+    'Player': ('string', 'string'),
+    'Points': ('float64', 'float64'),
+}
+
+COMPLETE_STATS_SCHEMA = {
+    'Player': ('string', 'string'),
+    'Season': ('string', 'string'),
+    'MVP_Points': ('float64', 'float64'),
+    'GP': ('Int64', 'int64'),
+    'MPG': ('float64', 'float64'),
+    'PTS': ('float64', 'float64'),
+    'REB': ('float64', 'float64'),
+    'AST': ('float64', 'float64'),
+    'STL': ('float64', 'float64'),
+    'BLK': ('float64', 'float64'),
+    'FG_PCT': ('float64', 'float64'),
+    'FG3_PCT': ('float64', 'float64'),
+    'FT_PCT': ('float64', 'float64'),
+    'TEAM': ('string', 'string'),
+    'TEAM_RECORD': ('string', 'string'),
+    'TEAM_WIN_PCT': ('float64', 'float64'),
+    'GAME_SCORE': ('float64', 'float64'),
+    'SIMPLE_PER': ('float64', 'float64'),
+    'IMPACT_SCORE': ('float64', 'float64'),
+    'PAST_MVP_WINNER': ('bool', 'bool_'),
+}
+
+PARTITION_COLUMN = 'Season'
+
+
+def is_csv(path):
+    return str(path).lower().endswith('.csv')
+
+
+def _arrow_schema(schema, df):
+    # Declared types for schema columns; anything else (e.g. extra metrics) keeps the
+    # type Arrow infers, so Parquet stores the same columns the CSV export would
+    import pyarrow as pa
+
+    inferred = pa.Schema.from_pandas(df, preserve_index=False)
+    return pa.schema([pa.field(name, getattr(pa, schema[name][1])()) if name in schema
+                      else inferred.field(name) for name in df.columns])
+
+
+def _apply_dtypes(df, schema):
+    dtypes = {name: schema[name][0] for name in df.columns if name in schema}
+    return df.astype(dtypes)
+
+
+def _replace_path(tmp_path, path):
+    # Swap a freshly written file or directory into place; a directory cannot be
+    # renamed over a non-empty one, so the old copy is moved aside first
+    if os.path.isdir(path):
+        old_path = f"{path}.old"
+        shutil.rmtree(old_path, ignore_errors=True)
+        os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+    else:
+        os.replace(tmp_path, path)
+
+
+def read_table(path, schema, columns=None, seasons=None):
+    # columns: projection; seasons: only these Season partitions are read
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    if is_csv(path):
+        usecols = None
+        if columns is not None:
+            usecols = list(dict.fromkeys(list(columns) + ([PARTITION_COLUMN] if seasons is not None else [])))
+        df = pd.read_csv(path, usecols=usecols,
+                         dtype={name: spec[0] for name, spec in schema.items() if spec[0] != 'bool'})
+        if seasons is not None:
+            df = df[df[PARTITION_COLUMN].isin(list(seasons))].reset_index(drop=True)
+            if columns is not None:
+                df = df[list(columns)]
+        return _apply_dtypes(df, schema)
+
+    import pyarrow.parquet as pq
+
+    filters = [(PARTITION_COLUMN, 'in', list(seasons))] if seasons is not None else None
+    table = pq.read_table(path, columns=list(columns) if columns is not None else None,
+                          filters=filters, partitioning='hive')
+    df = table.to_pandas()
+    # Partition values come back as categories; restore the declared dtype
+    if PARTITION_COLUMN in df.columns:
+        df[PARTITION_COLUMN] = df[PARTITION_COLUMN].astype(str)
+    if columns is None:
+        df = df[[name for name in schema if name in df.columns] +
+                [name for name in df.columns if name not in schema]]
+    return _apply_dtypes(df, schema)
+
+
+def write_table(df, path, schema):
+    tmp_path = f"{path}.tmp"
+    if is_csv(path):
+        df.to_csv(tmp_path, index=False)
+        _replace_path(tmp_path, path)
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    typed = _apply_dtypes(df, schema)
+    table = pa.Table.from_pandas(typed, schema=_arrow_schema(schema, typed), preserve_index=False)
+    pq.write_to_dataset(table, tmp_path, partition_cols=[PARTITION_COLUMN])
+    _replace_path(tmp_path, path)
+
+
+def read_voting_results(path='mvp_voting_results.csv', columns=None, seasons=None):
+    return read_table(path, VOTING_RESULTS_SCHEMA, columns, seasons)
+
+
+def write_voting_results(df, path='mvp_voting_results.csv'):
+    write_table(df, path, VOTING_RESULTS_SCHEMA)
+
+
+def read_award_voting(path='award_voting_results.csv', columns=None, seasons=None):
+    return read_table(path, AWARD_VOTING_SCHEMA, columns, seasons)
+
+
+def write_award_voting(df, path='award_voting_results.csv'):
+    write_table(df, path, AWARD_VOTING_SCHEMA)
+
+
+def read_complete_stats(path='mvp_complete_stats.csv', columns=None, seasons=None):
+    return read_table(path, COMPLETE_STATS_SCHEMA, columns, seasons)
+
+
+def write_complete_stats(df, path='mvp_complete_stats.csv'):
+    write_table(df, path, COMPLETE_STATS_SCHEMA)
+
+
+def export_csv(source, destination, schema=COMPLETE_STATS_SCHEMA):
+    write_table(read_table(source, schema), destination, schema)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert pipeline tables between Parquet and CSV")
+    parser.add_argument('source')
+    parser.add_argument('destination')
+    parser.add_argument('--table', choices=['voting', 'awards', 'stats'], default='stats')
+    args = parser.parse_args()
+
+    schema = {
+        'voting': VOTING_RESULTS_SCHEMA,
+        'awards': AWARD_VOTING_SCHEMA,
+        'stats': COMPLETE_STATS_SCHEMA,
+    }[args.table]
+    export_csv(args.source, args.destination, schema)
+    print(f"Wrote {args.destination}")
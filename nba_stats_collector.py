@@ -1,14 +1,79 @@
 # NBA Stats collector using NBA API playergamelog endpoint
 import pandas as pd
-import requests
 import time
 import json
 from datetime import datetime
 import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from checkpoint_store import CheckpointStore
+from instrumentation import Telemetry
+from game_log_stats import (COUNTING_STATS, accumulate_game_log, summarize_game_log, summarize_running_totals,
+                            summarize_totals)
+from metrics import STORED_METRICS, compute_metrics
+from mvp_features import past_winner_lookup, season_winners
+from mvp_storage import COMPLETE_STATS_SCHEMA, read_complete_stats, read_voting_results, write_complete_stats
+from player_directory import PlayerDirectory, normalize_name
+from rate_limiter import TokenBucket
+from season_totals_store import SeasonTotalsStore
+from standings_index import StandingsIndex
+from response_cache import CacheMissError, ResponseCache, season_is_final
+from stats_transport import DEFAULT_BASE_URL, StatsRequestError, StatsTransport
+
+# leaguedashplayerstats rejects requests that omit any of its filters, so the
+# unused ones are sent empty; PerMode=Totals lets summarize_totals do the rounding
+LEAGUE_DASH_PARAMS = {
+    'LeagueID': '00',
+    'SeasonType': 'Regular Season',
+    'PerMode': 'Totals',
+    'MeasureType': 'Base',
+    'PaceAdjust': 'N',
+    'PlusMinus': 'N',
+    'Rank': 'N',
+    'LastNGames': '0',
+    'Month': '0',
+    'OpponentTeamID': '0',
+    'Period': '0',
+    'TeamID': '0',
+    'College': '',
+    'Conference': '',
+    'Country': '',
+    'DateFrom': '',
+    'DateTo': '',
+    'Division': '',
+    'DraftPick': '',
+    'DraftYear': '',
+    'GameScope': '',
+    'GameSegment': '',
+    'Height': '',
+    'Location': '',
+    'Outcome': '',
+    'PORound': '0',
+    'PlayerExperience': '',
+    'PlayerPosition': '',
+    'SeasonSegment': '',
+    'ShotClockRange': '',
+    'StarterBench': '',
+    'TwoWay': '0',
+    'VsConference': '',
+    'VsDivision': '',
+    'Weight': '',
+}
 
 class NBAStatsCollector:
-    def __init__(self):
-        self.base_url = "https://stats.nba.com/stats"
+    def __init__(self, cache_dir='.nba_cache', requests_per_second=1.0, base_url=DEFAULT_BASE_URL,
+                 max_retries=4, pool_size=10, offline=False, incremental=False):
+        self.base_url = base_url
+        # incremental: keep running season totals per player and fetch only games since
+        # the last one seen, instead of re-downloading the whole game log
+        self.season_totals = SeasonTotalsStore(f"{cache_dir}/season_totals.sqlite") if incremental else None
+        self.player_directory = PlayerDirectory(f"{cache_dir}/players")
+        # One bucket for the whole collector so concurrent workers share the same ceiling
+        self.rate_limiter = TokenBucket(requests_per_second)
+        self.telemetry = Telemetry('collector')
+        self._standings = {}
+        self._standings_lock = threading.Lock()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'application/json',
@@ -18,37 +83,44 @@ class NBAStatsCollector:
             'x-nba-stats-origin': 'stats',
             'x-nba-stats-token': 'true'
         }
+        self.transport = StatsTransport(
+            self.headers,
+            base_url=base_url,
+            rate_limiter=self.rate_limiter,
+            max_retries=max_retries,
+            pool_size=pool_size,
+            cache=ResponseCache(f"{cache_dir}/responses.sqlite", offline=offline),
+            telemetry=self.telemetry
+        )
         
     def season_to_year(self, season_str):
         return season_str
     
     def get_player_id(self, player_name, season):
-        url = f"{self.base_url}/commonallplayers"
+        try:
+            player_id = self.player_directory.lookup(player_name, season, self._fetch_all_players)
+        except (CacheMissError, StatsRequestError):
+            raise
+        except Exception as e:
+            print(f"Error finding player ID for {player_name}: {e}")
+            return None
+
+        if player_id is None:
+            print(f"Player ID not found for {player_name}")
+        return player_id
+    
+    def _fetch_all_players(self, season):
+        # Full commonallplayers roster, fetched once per season and cached on disk
         params = {
             'LeagueID': '00',
             'Season': season,
             'IsOnlyCurrentSeason': '0'
         }
         
-        try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            players = data['resultSets'][0]['rowSet']
-            player_name_clean = player_name.lower().strip()
-            
-            for player in players:
-                player_id, full_name = player[0], player[2].lower()
-                if player_name_clean in full_name or full_name in player_name_clean:
-                    return player_id
-                    
-            print(f"Player ID not found for {player_name}")
-            return None
-            
-        except Exception as e:
-            print(f"Error finding player ID for {player_name}: {e}")
-            return None
+        data = self.transport.get_json('commonallplayers', params)
+        
+        players = data['resultSets'][0]['rowSet']
+        return [(player[0], player[2]) for player in players]
     
     def get_player_season_stats(self, player_id, season):
         stats = {}
@@ -65,7 +137,9 @@ class NBAStatsCollector:
         return stats
     
     def _get_traditional_stats(self, player_id, season):
-        url = f"{self.base_url}/playergamelog"
+        if self.season_totals is not None:
+            return self._get_traditional_stats_incremental(player_id, season)
+        
         params = {
             'PlayerID': player_id,
             'Season': season,
@@ -73,9 +147,7 @@ class NBAStatsCollector:
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self.transport.get_json('playergamelog', params)
             
             rows = data['resultSets'][0]['rowSet']
             headers = data['resultSets'][0]['headers']
@@ -83,313 +155,396 @@ class NBAStatsCollector:
             if not rows:
                 return None
             
-            # Calculate averages from game log
-            gp = len(rows)
-            totals = {
-                'MIN': 0, 'PTS': 0, 'REB': 0, 'AST': 0, 'STL': 0, 'BLK': 0,
-                'FGM': 0, 'FGA': 0, 'FG3M': 0, 'FG3A': 0, 'FTM': 0, 'FTA': 0
-            }
-            team = None
-            
-            wins = 0
-            losses = 0
-            
-            for row in rows:
-                row_dict = dict(zip(headers, row))
-                if team is None:
-                    team = row_dict.get('MATCHUP', '').split()[0]  # Get team abbreviation
-                
-                # Track W/L from game log
-                wl = row_dict.get('WL', '')
-                if wl == 'W':
-                    wins += 1
-                elif wl == 'L':
-                    losses += 1
-                
-                totals['MIN'] += row_dict.get('MIN', 0) or 0
-                totals['PTS'] += row_dict.get('PTS', 0) or 0
-                totals['REB'] += row_dict.get('REB', 0) or 0
-                totals['AST'] += row_dict.get('AST', 0) or 0
-                totals['STL'] += row_dict.get('STL', 0) or 0
-                totals['BLK'] += row_dict.get('BLK', 0) or 0
-                totals['FGM'] += row_dict.get('FGM', 0) or 0
-                totals['FGA'] += row_dict.get('FGA', 0) or 0
-                totals['FG3M'] += row_dict.get('FG3M', 0) or 0
-                totals['FG3A'] += row_dict.get('FG3A', 0) or 0
-                totals['FTM'] += row_dict.get('FTM', 0) or 0
-                totals['FTA'] += row_dict.get('FTA', 0) or 0
-            
-            # Calculate shooting percentages
-            fg_pct = (totals['FGM'] / totals['FGA'] * 100) if totals['FGA'] > 0 else 0
-            fg3_pct = (totals['FG3M'] / totals['FG3A'] * 100) if totals['FG3A'] > 0 else 0
-            ft_pct = (totals['FTM'] / totals['FTA'] * 100) if totals['FTA'] > 0 else 0
-            
-            return {
-                'GP': gp,
-                'MPG': round(totals['MIN'] / gp, 1),
-                'PTS': round(totals['PTS'] / gp, 1),
-                'REB': round(totals['REB'] / gp, 1),
-                'AST': round(totals['AST'] / gp, 1),
-                'STL': round(totals['STL'] / gp, 1),
-                'BLK': round(totals['BLK'] / gp, 1),
-                'FG_PCT': round(fg_pct, 1),
-                'FG3_PCT': round(fg3_pct, 1),
-                'FT_PCT': round(ft_pct, 1),
-                'TEAM': team or 'N/A',
-                'TEAM_WINS': wins,
-                'TEAM_LOSSES': losses
-            }
+            # Column-wise aggregation of the whole game log
+            return summarize_game_log(headers, rows)
             
+        except (CacheMissError, StatsRequestError):
+            # Exhausted retries are a failed run, not a candidate without stats
+            raise
         except Exception as e:
             print(f"Error getting Big 5 stats: {e}")
             return None
     
-    def _calculate_advanced_metrics(self, stats):
-        if not stats:
-            return {}
-        
-        # Calculate Team Win % from TEAM_WINS and TEAM_LOSSES
-        team_wins = stats.get('TEAM_WINS', 0)
-        team_losses = stats.get('TEAM_LOSSES', 0)
-        if team_wins > 0 or team_losses > 0:
-            team_win_pct = round(team_wins / (team_wins + team_losses) * 100, 1)
-        else:
-            team_win_pct = None
-        
-        # Calculate Game Score (all-around performance metric)
-        game_score = round(
-            stats.get('PTS', 0) + 
-            0.4 * stats.get('REB', 0) + 
-            0.7 * stats.get('AST', 0) + 
-            stats.get('STL', 0) + 
-            0.7 * stats.get('BLK', 0),
-            1
-        )
-        
-        # Calculate Simple PER
-        simple_per = round(
-            (stats.get('PTS', 0) + stats.get('REB', 0) + stats.get('AST', 0) + 
-             stats.get('STL', 0) + stats.get('BLK', 0)) / 5,
-            1
-        )
-        
-        # Calculate Impact Score
-        impact_score = round(
-            stats.get('PTS', 0) * 1.0 +
-            stats.get('REB', 0) * 0.7 +
-            stats.get('AST', 0) * 0.7 +
-            stats.get('STL', 0) * 1.5 +
-            stats.get('BLK', 0) * 1.5,
-            1
-        )
-        
-        return {
-            'TEAM_WIN_PCT': team_win_pct,
-            'GAME_SCORE': game_score,
-            'SIMPLE_PER': simple_per,
-            'IMPACT_SCORE': impact_score
-        }
-    
-    def get_team_record(self, team_abbr, season):
-        url = f"{self.base_url}/leaguestandingsv3"
+    def _get_traditional_stats_incremental(self, player_id, season):
+        state = self.season_totals.get(player_id, season)
         params = {
-            'LeagueID': '00',
+            'PlayerID': player_id,
             'Season': season,
             'SeasonType': 'Regular Season'
         }
+        if state and state['last_game_date']:
+            # DateFrom is inclusive, so games posted late on the last synced day still
+            # arrive; anything already counted is dropped by Game_ID
+            last = datetime.strptime(state['last_game_date'], '%Y-%m-%d')
+            params['DateFrom'] = last.strftime('%m/%d/%Y')
+        
+        # The running totals already hold everything before DateFrom, so a cached copy of a
+        # live season's window is never trusted without asking the server. First syncs and
+        # finished seasons keep the normal cache rules
+        revalidate = 'DateFrom' in params and not season_is_final(season)
         
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            rows = data['resultSets'][0]['rowSet']
-            headers = data['resultSets'][0]['headers']
-            
-            for row in rows:
-                row_dict = dict(zip(headers, row))
-                team_abbrev = row_dict.get('TeamAbbreviation', '')
-                
-                # Match by abbreviation
-                if team_abbrev == team_abbr:
-                    wins = row_dict.get('WINS', row_dict.get('W', 0))
-                    losses = row_dict.get('LOSSES', row_dict.get('L', 0))
-                    return f"{wins}-{losses}"
-            
-            # If not found, try alternate method with team info
-            team_id = self._get_team_id(team_abbr)
-            if team_id and team_id != '0':
-                return self._get_team_record_by_id(team_id, season)
-            
-            return "N/A"
+            data = self.transport.get_json('playergamelog', params, revalidate=revalidate)
+            result_set = data['resultSets'][0]
+            state, added = accumulate_game_log(state, result_set['headers'], result_set['rowSet'])
+            if added:
+                self.season_totals.put(player_id, season, state)
+            return summarize_running_totals(state)
+            
+        except (CacheMissError, StatsRequestError):
+            raise
+        except Exception as e:
+            print(f"Error getting Big 5 stats: {e}")
+            return None
+    
+    def _calculate_advanced_metrics(self, stats):
+        # Formulas live in the metrics registry so they can be recomputed offline
+        if not stats:
+            return {}
+        return compute_metrics(stats, STORED_METRICS)
+    
+    def get_standings_index(self, season):
+        # leaguestandingsv3 is fetched once per season and shared by every team lookup
+        with self._standings_lock:
+            if season in self._standings:
+                return self._standings[season]
+            
+            params = {
+                'LeagueID': '00',
+                'Season': season,
+                'SeasonType': 'Regular Season'
+            }
             
+            with self.telemetry.stage('standings'):
+                data = self.transport.get_json('leaguestandingsv3', params)
+            result_set = data['resultSets'][0]
+            index = StandingsIndex.from_result_set(season, result_set['headers'], result_set['rowSet'])
+            self._standings[season] = index
+            return index
+    
+    def get_team_record(self, team_abbr, season):
+        try:
+            return self.get_standings_index(season).record_string(team_abbr)
+        except (CacheMissError, StatsRequestError):
+            raise
         except Exception as e:
             print(f"    Error getting team record: {e}")
-            team_id = self._get_team_id(team_abbr)
-            if team_id and team_id != '0':
-                return self._get_team_record_by_id(team_id, season)
             return "N/A"
     
-    def _get_team_record_by_id(self, team_id, season):
-        """Backup method to get team record using team ID"""
-        url = f"{self.base_url}/teaminfocommon"
-        params = {
-            'TeamID': team_id,
-            'Season': season,
-            'SeasonType': 'Regular Season'
-        }
+    def check_past_mvp_winner(self, player_name, season, mvp_data):
+        season_year = int(season.split('-')[0])
         
-        try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            rows = data['resultSets'][0]['rowSet']
-            headers = data['resultSets'][0]['headers']
-            
-            if rows:
-                row_dict = dict(zip(headers, rows[0]))
-                wins = row_dict.get('W', 0)
-                losses = row_dict.get('L', 0)
-                return f"{wins}-{losses}"
-            
-            return "N/A"
-            
-        except Exception as e:
-            return "N/A"
+        winners = season_winners(mvp_data, points_col='Points')
+        previous = winners[(winners['START_YEAR'] < season_year) & (winners['Player'] == player_name)]
+        return not previous.empty
     
-    def _get_team_id(self, team_abbr):
-        team_map = {
-            'LAL': '1610612747', 'BOS': '1610612738', 'CHI': '1610612741',
-            'MIA': '1610612748', 'GSW': '1610612744', 'SAS': '1610612759',
-            'HOU': '1610612745', 'PHI': '1610612755', 'DEN': '1610612743',
-            'MIL': '1610612749', 'PHX': '1610612756', 'OKC': '1610612760',
-            'DAL': '1610612742', 'CLE': '1610612739', 'TOR': '1610612761',
-            'MEM': '1610612763', 'POR': '1610612757', 'UTA': '1610612762',
-            'ORL': '1610612753', 'MIN': '1610612750', 'NOP': '1610612740',
-            'SAC': '1610612758', 'BKN': '1610612751', 'DET': '1610612765',
-            'ATL': '1610612737', 'WAS': '1610612764', 'IND': '1610612754',
-            'CHO': '1610612766', 'NYK': '1610612752', 'LAC': '1610612746'
+    def _collect_candidate(self, row, past_winners, label):
+        player_name = row['Player']
+        season = row['Season']
+        mvp_points = row['Points']
+        
+        print(f"\n{label} Processing {player_name} ({season})")
+        
+        with self.telemetry.stage('player_lookup'):
+            player_id = self.get_player_id(player_name, season)
+        if not player_id:
+            print(f"Skipping - couldn't find player ID")
+            self.telemetry.count('candidates.no_player_id')
+            return None
+        
+        print(f"Found player ID: {player_id}")
+        
+        with self.telemetry.stage('player_stats'):
+            stats = self.get_player_season_stats(player_id, season)
+        
+        if not stats:
+            print(f"No stats found for this season")
+            self.telemetry.count('candidates.no_stats')
+            return None
+        
+        past_winner = past_winners.get((player_name, season), False)
+        result = self._result_row(player_name, season, mvp_points, stats, past_winner)
+        
+        print(f"Stats collected: {stats.get('PTS', 0)} PTS, {stats.get('REB', 0)} REB, {stats.get('AST', 0)} AST")
+        return result
+    
+    def _result_row(self, player_name, season, mvp_points, stats, past_winner):
+        # Get team record from game log data
+        team_record = "N/A"
+        if 'TEAM_WINS' in stats and 'TEAM_LOSSES' in stats:
+            team_record = f"{stats['TEAM_WINS']}-{stats['TEAM_LOSSES']}"
+        
+        return {
+            'Player': player_name,
+            'Season': season,
+            'MVP_Points': mvp_points,
+            'GP': stats.get('GP', None),
+            'MPG': stats.get('MPG', None),
+            'PTS': stats.get('PTS', None),
+            'REB': stats.get('REB', None),
+            'AST': stats.get('AST', None),
+            'STL': stats.get('STL', None),
+            'BLK': stats.get('BLK', None),
+            'FG_PCT': stats.get('FG_PCT', None),
+            'FG3_PCT': stats.get('FG3_PCT', None),
+            'FT_PCT': stats.get('FT_PCT', None),
+            'TEAM': stats.get('TEAM', 'N/A'),
+            'TEAM_RECORD': team_record,
+            'TEAM_WIN_PCT': stats.get('TEAM_WIN_PCT', None),
+            'GAME_SCORE': stats.get('GAME_SCORE', None),
+            'SIMPLE_PER': stats.get('SIMPLE_PER', None),
+            'IMPACT_SCORE': stats.get('IMPACT_SCORE', None),
+            'PAST_MVP_WINNER': past_winner
         }
-        return team_map.get(team_abbr, '0')
     
-    def check_past_mvp_winner(self, player_name, season, mvp_data):
+    def get_league_player_stats(self, season):
+        # Season totals for every player in one request
+        params = dict(LEAGUE_DASH_PARAMS, Season=season)
+        with self.telemetry.stage('league_dash'):
+            data = self.transport.get_json('leaguedashplayerstats', params)
+        result_set = data['resultSets'][0]
+        return result_set['headers'], result_set['rowSet']
+    
+    def build_league_pool(self, season, mvp_data=None, min_games=1, record_source='games'):
+        # Every player of a season as mvp_complete_stats rows, from the league dash
+        # endpoint plus (at most) one standings request instead of a game log per player.
+        # record_source='games' keeps the historical meaning of TEAM_RECORD (the player's
+        # games won-lost, like the game log path); 'standings' uses the team's record
+        headers, rows = self.get_league_player_stats(season)
+        position = {header: i for i, header in enumerate(headers)}
         season_year = int(season.split('-')[0])
         
-        previous_seasons = mvp_data[mvp_data['Year'] < season_year]
+        # Voting points and earlier MVP wins, matched on folded names
+        voters = {}
+        past_winners = set()
+        if mvp_data is not None and not mvp_data.empty:
+            season_votes = mvp_data[mvp_data['Season'] == season]
+            voters = {normalize_name(name): (name, points)
+                      for name, points in zip(season_votes['Player'], season_votes['Points'])}
+            winners = season_winners(mvp_data, points_col='Points')
+            past_winners = set(winners.loc[winners['START_YEAR'] < season_year, 'Player'].map(normalize_name))
+        
+        def value(row, column):
+            return row[position[column]] if column in position else None
         
-        for _, row in previous_seasons.iterrows():
-            season_data = mvp_data[mvp_data['Year'] == row['Year']]
-            max_points = season_data['Points'].max()
+        standings = None
+        results = []
+        for row in rows:
+            gp = int(value(row, 'GP') or 0)
+            if gp < max(min_games, 1):
+                continue
             
-            if row['Points'] == max_points and row['Player'] == player_name:
-                return True
+            totals = {stat: float(value(row, stat) or 0) for stat in COUNTING_STATS}
+            team = value(row, 'TEAM_ABBREVIATION')
+            wins = int(value(row, 'W') or 0)
+            losses = int(value(row, 'L') or 0)
+            if record_source == 'standings' or wins + losses == 0:
+                # Joined in memory from one leaguestandingsv3 response per season
+                standings = standings or self.get_standings_index(season)
+                record = standings.record(team)
+                if record is not None:
+                    wins, losses = int(record['wins']), int(record['losses'])
+            
+            stats = summarize_totals(gp, totals, team, wins, losses)
+            stats.update(self._calculate_advanced_metrics(stats))
+            
+            key = normalize_name(value(row, 'PLAYER_NAME'))
+            player_name, mvp_points = voters.get(key, (value(row, 'PLAYER_NAME'), 0.0))
+            results.append(self._result_row(player_name, season, mvp_points, stats, key in past_winners))
+        
+        return pd.DataFrame(results, columns=list(COMPLETE_STATS_SCHEMA))
+    
+    def collect_league_pools(self, seasons, input_csv='mvp_voting_results.csv', output_csv='league_candidates.csv',
+                             min_games=1, record_source='games', trace_path=None):
+        print("Running League Pool Collector")
+        
+        try:
+            mvp_data = read_voting_results(input_csv)
+        except FileNotFoundError:
+            print(f"{input_csv} not found; MVP points and past winners will be empty")
+            mvp_data = None
+        
+        requests_before = self.transport.network_requests
+        frames = []
+        for season in seasons:
+            pool = self.build_league_pool(season, mvp_data, min_games, record_source)
+            print(f"{season}: {len(pool)} players")
+            frames.append(pool)
         
-        return False
+        pools = pd.concat(frames, ignore_index=True)
+        with self.telemetry.stage('export'):
+            write_complete_stats(pools, output_csv)
+        print(f"Complete; {len(pools)} players from {len(seasons)} season(s) saved to {output_csv} "
+              f"({self.transport.network_requests - requests_before} network requests)")
+        self.telemetry.report()
+        if trace_path:
+            self.telemetry.write_trace(trace_path)
+            print(f"Trace written to {trace_path}")
+        return pools
+    
+    def _collect_serial(self, pending, past_winners, total):
+        for idx, row in pending:
+            requests_before = self.transport.network_requests
+            result = self._collect_candidate(row, past_winners, f"[{idx+1}/{total}]")
+            # Politeness delay only matters when we actually hit the network
+            hit_network = self.transport.network_requests != requests_before
+            if result is None:
+                if hit_network:
+                    with self.telemetry.stage('politeness_sleep'):
+                        time.sleep(1)
+                yield None
+                continue
+            
+            yield result
+            if hit_network:
+                with self.telemetry.stage('politeness_sleep'):
+                    time.sleep(random.uniform(0.6, 1.2))
     
-    def scrape_all_stats(self, input_csv='mvp_voting_results.csv', output_csv='mvp_complete_stats.csv'):
+    def _collect_concurrent(self, pending, past_winners, total, workers):
+        # Requests overlap across workers but all draw from self.rate_limiter. Only a
+        # small window of candidates is submitted ahead, and results are yielded in
+        # input order so rows match the serial path
+        window = deque()
+        items = iter(pending)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for idx, row in items:
+                window.append(executor.submit(self._collect_candidate, row, past_winners, f"[{idx+1}/{total}]"))
+                if len(window) >= workers * 2:
+                    yield window.popleft().result()
+            while window:
+                yield window.popleft().result()
+        except Exception:
+            # A fatal error (e.g. StatsRequestError) stops the run: queued candidates are
+            # cancelled, and those already running still reach the checkpoint
+            for future in window:
+                future.cancel()
+            executor.shutdown(wait=True)
+            finished = [future.result() for future in window
+                        if not future.cancelled() and future.exception() is None]
+            window.clear()
+            yield from finished
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def scrape_all_stats(self, input_csv='mvp_voting_results.csv', output_csv='mvp_complete_stats.csv', workers=1,
+                         checkpoint_path=None, refresh_seasons=(), trace_path=None):
         print("Running Stat Collector")
         
-        # Read existing data from csv
-        mvp_data = pd.read_csv(input_csv)
+        # Read existing data (CSV or Parquet dataset)
+        with self.telemetry.stage('read_inputs'):
+            mvp_data = read_voting_results(input_csv)
         print(f"\nLoaded {len(mvp_data)} players from {input_csv}")
         
         try:
-            existing_data = pd.read_csv(output_csv)
+            with self.telemetry.stage('read_inputs'):
+                existing_data = read_complete_stats(output_csv)
             completed = set(zip(existing_data['Player'], existing_data['Season']))
             print(f"Found existing data with {len(completed)} completed entries")
         except FileNotFoundError:
             completed = set()
             existing_data = None
         
-        results = []
+        # Rows collected since the last export live in an append-only log next to the CSV
+        checkpoint = CheckpointStore(checkpoint_path or f"{output_csv}.checkpoint.sqlite")
+        resumed = checkpoint.completed_keys() - completed
+        if resumed:
+            print(f"Resuming with {len(resumed)} checkpointed entries")
+        completed |= resumed
+        
+        # Seasons still in progress are collected again; rows replace the exported ones
+        if refresh_seasons:
+            completed = {key for key in completed if key[1] not in set(refresh_seasons)}
+            # Only voting-results rows are refreshed; a live season without votes needs --league
+            for season in sorted(set(refresh_seasons) - set(mvp_data['Season'])):
+                print(f"No {season} candidates in {input_csv}; collect that season's pool with --league")
         
+        # Past-winner flag for every candidate in one pass over the voting history
+        past_winners = past_winner_lookup(mvp_data, points_col='Points')
+        
+        pending = []
         for idx, row in mvp_data.iterrows():
-            player_name = row['Player']
-            season = row['Season']
-            mvp_points = row['Points']
-            
-            if (player_name, season) in completed:
-                print(f"\n[{idx+1}/{len(mvp_data)}] Skipping {player_name} ({season}) - already completed")
+            if (row['Player'], row['Season']) in completed:
+                print(f"\n[{idx+1}/{len(mvp_data)}] Skipping {row['Player']} ({row['Season']}) - already completed")
                 continue
-            
-            print(f"\n[{idx+1}/{len(mvp_data)}] Processing {player_name} ({season})")
-            
-            player_id = self.get_player_id(player_name, season)
-            if not player_id:
-                print(f"Skipping - couldn't find player ID")
-                time.sleep(1)
-                continue
-            
-            print(f"Found player ID: {player_id}")
-            
-            stats = self.get_player_season_stats(player_id, season)
-            
-            if not stats:
-                print(f"No stats found for this season")
-                time.sleep(1)
+            pending.append((idx, row))
+        
+        if workers > 1:
+            print(f"Collecting {len(pending)} candidates with {workers} workers")
+            collected = self._collect_concurrent(pending, past_winners, len(mvp_data), workers)
+        else:
+            collected = self._collect_serial(pending, past_winners, len(mvp_data))
+        
+        new_entries = 0
+        for result in collected:
+            if result is None:
                 continue
             
-            past_winner = self.check_past_mvp_winner(player_name, season, mvp_data)
-            
-            # Get team record from game log data
-            team_record = "N/A"
-            if 'TEAM_WINS' in stats and 'TEAM_LOSSES' in stats:
-                team_record = f"{stats['TEAM_WINS']}-{stats['TEAM_LOSSES']}"
-            
-            result = {
-                'Player': player_name,
-                'Season': season,
-                'MVP_Points': mvp_points,
-                'GP': stats.get('GP', None),
-                'MPG': stats.get('MPG', None),
-                'PTS': stats.get('PTS', None),
-                'REB': stats.get('REB', None),
-                'AST': stats.get('AST', None),
-                'STL': stats.get('STL', None),
-                'BLK': stats.get('BLK', None),
-                'FG_PCT': stats.get('FG_PCT', None),
-                'FG3_PCT': stats.get('FG3_PCT', None),
-                'FT_PCT': stats.get('FT_PCT', None),
-                'TEAM': stats.get('TEAM', 'N/A'),
-                'TEAM_RECORD': team_record,
-                'TEAM_WIN_PCT': stats.get('TEAM_WIN_PCT', None),
-                'GAME_SCORE': stats.get('GAME_SCORE', None),
-                'SIMPLE_PER': stats.get('SIMPLE_PER', None),
-                'IMPACT_SCORE': stats.get('IMPACT_SCORE', None),
-                'PAST_MVP_WINNER': past_winner
-            }
-            
-            results.append(result)
+            with self.telemetry.stage('checkpoint_append'):
+                checkpoint.append(result)
+            new_entries += 1
+            self.telemetry.count('candidates.collected')
             
-            print(f"Stats collected: {stats.get('PTS', 0)} PTS, {stats.get('REB', 0)} REB, {stats.get('AST', 0)} AST")
-            
-            if len(results) % 10 == 0:
-                temp_df = pd.DataFrame(results)
-                if existing_data is not None:
-                    temp_df = pd.concat([existing_data, temp_df], ignore_index=True)
-                temp_df.to_csv(output_csv, index=False)
-                print(f"\nProgress saved ({len(results)} new entries)")
-                existing_data = temp_df
-                results = []
-            
-            time.sleep(random.uniform(0.6, 1.2))
+            if new_entries % 10 == 0:
+                print(f"\nProgress saved ({new_entries} new entries)")
         
-        if results:
-            final_df = pd.DataFrame(results)
-            if existing_data is not None:
-                final_df = pd.concat([existing_data, final_df], ignore_index=True)
-            final_df.to_csv(output_csv, index=False)
+        with self.telemetry.stage('export'):
+            final_data = checkpoint.compact(output_csv, existing_data)
+        checkpoint.close()
         
-        print(f"Complete; Data saved to {output_csv}")
+        self.telemetry.report()
+        if trace_path:
+            self.telemetry.write_trace(trace_path)
+            print(f"Trace written to {trace_path}")
         
+        if final_data is None or final_data.empty:
+            print("No data collected")
+            return
         
-        final_data = pd.read_csv(output_csv)
+        print(f"Complete; Data saved to {output_csv}")
         print(f"\nFinal dataset: {len(final_data)} players with complete stats")
         print(f"Seasons covered: {final_data['Season'].nunique()}")
         print(f"Date range: {final_data['Season'].min()} to {final_data['Season'].max()}")
 
 
+def main(argv=None, prog=None):
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog=prog, description="Collect season stats for MVP candidates")
+    parser.add_argument('--input', default='mvp_voting_results.csv', help="voting results (.csv or Parquet dataset)")
+    parser.add_argument('--output', default=None,
+                        help="complete stats (.csv or Parquet dataset); default mvp_complete_stats.csv, "
+                             "or league_candidates.csv with --league")
+    parser.add_argument('--workers', type=int, default=1, help="concurrent collection workers (1 = serial)")
+    parser.add_argument('--rps', type=float, default=1.0, help="shared requests-per-second ceiling")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help="stats API root (e.g. a local stand-in server)")
+    parser.add_argument('--offline', action='store_true', help="serve only from the response cache; fail fast on misses")
+    parser.add_argument('--refresh', nargs='+', metavar='SEASON', default=(),
+                        help="re-collect these in-progress seasons, fetching only new games (implies --incremental); "
+                             "only players already in --input are refreshed, so use --league for a live "
+                             "season with no votes yet")
+    parser.add_argument('--incremental', action='store_true',
+                        help="keep running totals per player and fetch only games after the last sync date")
+    parser.add_argument('--trace', default=None, help="write a JSON telemetry trace of the run here")
+    parser.add_argument('--league', nargs='+', metavar='SEASON',
+                        help="collect every player of these seasons (e.g. 2025-26) from league-wide endpoints")
+    parser.add_argument('--min-games', type=int, default=1, help="with --league, drop players under this many games")
+    parser.add_argument('--record-source', choices=['games', 'standings'], default='games',
+                        help="with --league, TEAM_RECORD from the player's games or the team standings")
+    args = parser.parse_args(argv)
+    
+    collector = NBAStatsCollector(requests_per_second=args.rps, base_url=args.base_url,
+                                  pool_size=max(10, args.workers), offline=args.offline,
+                                  incremental=args.incremental or bool(args.refresh))
+    if args.league:
+        collector.collect_league_pools(args.league, args.input, args.output or 'league_candidates.csv',
+                                       min_games=args.min_games, record_source=args.record_source,
+                                       trace_path=args.trace)
+    else:
+        collector.scrape_all_stats(args.input, args.output or 'mvp_complete_stats.csv', workers=args.workers,
+                                   refresh_seasons=args.refresh, trace_path=args.trace)
+
+
 if __name__ == "__main__":
-    collector = NBAStatsCollector()
-    collector.scrape_all_stats()
+    main()
@@ -0,0 +1,130 @@
+# Season-keyed player directory backed by an on-disk cache of commonallplayers
+import difflib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+
+from response_cache import CURRENT_SEASON_TTL, season_is_final
+
+
+SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+
+def fold_name(name):
+    # Fold accents and punctuation only: "Nikola Jokić" -> "nikola jokic",
+    # "Tim Hardaway Jr." -> "tim hardaway jr"
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch))
+    name = re.sub(r"[^a-z0-9 ]", ' ', name.lower().replace("'", ''))
+    return ' '.join(name.split())
+
+
+def normalize_name(name):
+    # fold_name plus generational suffixes dropped, so
+    # "Jaren Jackson Jr." and "Jaren Jackson" match
+    return ' '.join(part for part in fold_name(name).split() if part not in SUFFIXES)
+
+
+class PlayerDirectory:
+
+    def __init__(self, cache_dir='.nba_cache/players', current_season_ttl=CURRENT_SEASON_TTL):
+        self.cache_dir = cache_dir
+        # Finished seasons' rosters never change; live ones pick up signings after the TTL
+        self.current_season_ttl = current_season_ttl
+        self._indexes = {}
+        # One lock per season so workers on different seasons download in parallel
+        self._season_locks = {}
+        self._lock = threading.Lock()
+
+    def _season_lock(self, season):
+        with self._lock:
+            return self._season_locks.setdefault(season, threading.Lock())
+
+    def _expires_at(self, season, fetched_at):
+        if season_is_final(season):
+            return None
+        return fetched_at + self.current_season_ttl
+
+    def _cache_path(self, season):
+        return os.path.join(self.cache_dir, f"commonallplayers_{season}.json")
+
+    def _load_from_disk(self, season):
+        # (players, expires_at), or None when missing or a live season's copy is stale
+        path = self._cache_path(season)
+        if not os.path.exists(path):
+            return None
+        expires_at = self._expires_at(season, os.path.getmtime(path))
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f), expires_at
+
+    def _save_to_disk(self, season, players):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path(season)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(players, f)
+        os.replace(tmp_path, path)
+
+    def _build_index(self, players):
+        # (exact, loose): folded full names, and the same with suffixes dropped.
+        # Exact keys keep "Tim Hardaway Jr." apart from "Tim Hardaway"
+        exact, loose = {}, {}
+        for player_id, full_name in players:
+            # Keep the first entry for duplicate names, matching the old scan order
+            exact.setdefault(fold_name(full_name), player_id)
+            loose.setdefault(normalize_name(full_name), player_id)
+        return exact, loose
+
+    def get_index(self, season, fetch_players):
+        # fetch_players(season) returns [(player_id, full_name), ...] and is only
+        # called when the season is neither in memory nor on disk (or has expired)
+        with self._season_lock(season):
+            cached = self._indexes.get(season)
+            if cached is not None:
+                index, expires_at = cached
+                if expires_at is None or expires_at > time.time():
+                    return index
+
+            loaded = self._load_from_disk(season)
+            if loaded is not None:
+                players, expires_at = loaded
+            else:
+                players = fetch_players(season)
+                if players is None:
+                    return None
+                self._save_to_disk(season, players)
+                expires_at = self._expires_at(season, time.time())
+
+            index = self._build_index(players)
+            self._indexes[season] = (index, expires_at)
+            return index
+
+    def lookup(self, player_name, season, fetch_players):
+        index = self.get_index(season, fetch_players)
+        if not index:
+            return None
+        exact, loose = index
+
+        player_id = exact.get(fold_name(player_name))
+        if player_id is not None:
+            return player_id
+
+        # Fallbacks: suffix-insensitive match, then substring, then closest spelling
+        key = normalize_name(player_name)
+        player_id = loose.get(key)
+        if player_id is not None:
+            return player_id
+
+        for name, candidate_id in loose.items():
+            if key and name and (key in name or name in key):
+                return candidate_id
+
+        close = difflib.get_close_matches(key, loose.keys(), n=1, cutoff=0.85)
+        if close:
+            return loose[close[0]]
+        return None
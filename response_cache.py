@@ -0,0 +1,102 @@
+# Content-addressed on-disk cache for stats.nba.com JSON payloads (SQLite + zlib)
+import hashlib
+import json
+import time
+import zlib
+from datetime import date
+
+from sqlite_store import SQLiteStore
+
+
+# Seasons that are still in progress (or whose playoffs just ended) change daily
+CURRENT_SEASON_TTL = 6 * 60 * 60
+
+
+class CacheMissError(Exception):
+    pass
+
+
+def season_is_final(season, today=None):
+    # "2023-24" is final once the following July starts; no season param means "live"
+    if not season:
+        return False
+    today = today or date.today()
+    end_year = int(str(season)[:4]) + 1
+    return today >= date(end_year, 7, 1)
+
+
+def cache_key(endpoint, params):
+    canonical = json.dumps([endpoint, {str(k): str(v) for k, v in params.items()}], sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class CachedResponse:
+
+    def __init__(self, key, payload, etag, last_modified, expires_at):
+        self.key = key
+        self.payload = payload
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self):
+        return self.expires_at is None or self.expires_at > time.time()
+
+
+class ResponseCache(SQLiteStore):
+
+    def __init__(self, path='.nba_cache/responses.sqlite', current_season_ttl=CURRENT_SEASON_TTL, offline=False):
+        super().__init__(path, """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                params TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                expires_at REAL
+            )
+        """)
+        self.current_season_ttl = current_season_ttl
+        self.offline = offline
+
+    def _expires_at(self, params):
+        if season_is_final(params.get('Season')):
+            return None
+        return time.time() + self.current_season_ttl
+
+    def get(self, endpoint, params):
+        key = cache_key(endpoint, params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, expires_at = row
+        payload = json.loads(zlib.decompress(body).decode('utf-8'))
+        return CachedResponse(key, payload, etag, last_modified, expires_at)
+
+    def put(self, endpoint, params, payload, etag=None, last_modified=None):
+        key = cache_key(endpoint, params)
+        body = zlib.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, json.dumps(params, sort_keys=True, default=str), body,
+                 etag, last_modified, time.time(), self._expires_at(params))
+            )
+            self._conn.commit()
+
+    def revalidated(self, entry, params):
+        # Server answered 304 Not Modified: keep the body, restart its TTL
+        expires_at = self._expires_at(params)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, expires_at = ? WHERE key = ?",
+                (time.time(), expires_at, entry.key)
+            )
+            self._conn.commit()
+        entry.expires_at = expires_at
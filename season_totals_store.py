@@ -0,0 +1,34 @@
+# Per-player running season totals for incremental game-log refreshes
+import json
+
+from sqlite_store import SQLiteStore
+
+
+class SeasonTotalsStore(SQLiteStore):
+
+    def __init__(self, path):
+        super().__init__(path, """
+            CREATE TABLE IF NOT EXISTS running_totals (
+                player_id INTEGER NOT NULL,
+                season TEXT NOT NULL,
+                last_game_date TEXT,
+                state TEXT NOT NULL,
+                PRIMARY KEY (player_id, season)
+            )
+        """)
+
+    def get(self, player_id, season):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM running_totals WHERE player_id = ? AND season = ?",
+                (int(player_id), season)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, player_id, season, state):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO running_totals (player_id, season, last_game_date, state) VALUES (?, ?, ?, ?)",
+                (int(player_id), season, state['last_game_date'], json.dumps(state))
+            )
+            self._conn.commit()
@@ -0,0 +1,28 @@
+# Shared SQLite plumbing for the on-disk stores: one WAL-mode connection per store,
+# shared across threads behind a lock
+import os
+import sqlite3
+import threading
+
+
+class SQLiteStore:
+
+    def __init__(self, path, schema):
+        # schema: CREATE TABLE IF NOT EXISTS ... statement for the store's table
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL lets readers run alongside the writer; NORMAL syncs at checkpoints, which
+        # can lose the last commits on power loss but never corrupts the file
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(schema)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
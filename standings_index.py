@@ -0,0 +1,77 @@
+# Per-season league standings keyed by team ID and every abbreviation the team has used
+TEAM_IDS = {
+    'ATL': 1610612737, 'BOS': 1610612738, 'BKN': 1610612751, 'CHA': 1610612766,
+    'CHI': 1610612741, 'CLE': 1610612739, 'DAL': 1610612742, 'DEN': 1610612743,
+    'DET': 1610612765, 'GSW': 1610612744, 'HOU': 1610612745, 'IND': 1610612754,
+    'LAC': 1610612746, 'LAL': 1610612747, 'MEM': 1610612763, 'MIA': 1610612748,
+    'MIL': 1610612749, 'MIN': 1610612750, 'NOP': 1610612740, 'NYK': 1610612752,
+    'OKC': 1610612760, 'ORL': 1610612753, 'PHI': 1610612755, 'PHX': 1610612756,
+    'POR': 1610612757, 'SAC': 1610612758, 'SAS': 1610612759, 'TOR': 1610612761,
+    'UTA': 1610612762, 'WAS': 1610612764,
+}
+
+# Relocated/renamed franchises and basketball-reference spellings -> current abbreviation
+ABBREVIATION_ALIASES = {
+    'NJN': 'BKN', 'NJ': 'BKN', 'BRK': 'BKN',
+    'SEA': 'OKC',
+    'NOH': 'NOP', 'NOK': 'NOP', 'NO': 'NOP',
+    'CHH': 'CHA', 'CHO': 'CHA',
+    'VAN': 'MEM',
+    'PHO': 'PHX', 'GS': 'GSW', 'SA': 'SAS', 'NY': 'NYK', 'UTH': 'UTA', 'WSH': 'WAS',
+}
+
+
+def team_id_for(team):
+    # Accepts an abbreviation from any era or a team ID (int or str)
+    if team is None:
+        return None
+    text = str(team).strip().upper()
+    if text.isdigit():
+        return int(text)
+    text = ABBREVIATION_ALIASES.get(text, text)
+    return TEAM_IDS.get(text)
+
+
+class StandingsIndex:
+
+    def __init__(self, season, records):
+        # records: {team_id: {'wins': int, 'losses': int, 'win_pct': float}}
+        self.season = season
+        self.records = records
+        self._by_abbreviation = {}
+
+    @classmethod
+    def from_result_set(cls, season, headers, rows):
+        records = {}
+        by_abbreviation = {}
+        for row in rows:
+            row_dict = dict(zip(headers, row))
+            team_id = row_dict.get('TeamID')
+            if team_id is None:
+                continue
+            wins = row_dict.get('WINS', row_dict.get('W', 0)) or 0
+            losses = row_dict.get('LOSSES', row_dict.get('L', 0)) or 0
+            games = wins + losses
+            record = {
+                'wins': wins,
+                'losses': losses,
+                'win_pct': round(wins / games * 100, 1) if games else None
+            }
+            records[int(team_id)] = record
+            if row_dict.get('TeamAbbreviation'):
+                by_abbreviation[row_dict['TeamAbbreviation'].upper()] = record
+
+        index = cls(season, records)
+        index._by_abbreviation = by_abbreviation
+        return index
+
+    def record(self, team):
+        if team is not None and str(team).upper() in self._by_abbreviation:
+            return self._by_abbreviation[str(team).upper()]
+        return self.records.get(team_id_for(team))
+
+    def record_string(self, team):
+        record = self.record(team)
+        if record is None:
+            return "N/A"
+        return f"{record['wins']}-{record['losses']}"
@@ -0,0 +1,162 @@
+# Shared HTTP transport for stats.nba.com: pooled keep-alive session with retry/backoff
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from instrumentation import Telemetry
+from response_cache import CacheMissError
+
+
+DEFAULT_BASE_URL = "https://stats.nba.com/stats"
+
+# (connect, read) timeout budget per endpoint; the roster payload is by far the largest
+DEFAULT_TIMEOUTS = {
+    'commonallplayers': (5, 30),
+    'playergamelog': (5, 20),
+    'leaguestandingsv3': (5, 20),
+    'leaguedashplayerstats': (5, 30),
+}
+FALLBACK_TIMEOUT = (5, 30)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Longest Retry-After the transport will sleep through before giving up on the request
+MAX_RETRY_AFTER = 300.0
+
+
+class StatsRequestError(Exception):
+    pass
+
+
+def parse_retry_after(value):
+    # Retry-After is either a number of seconds or an HTTP date
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class StatsTransport:
+
+    def __init__(self, headers, base_url=DEFAULT_BASE_URL, rate_limiter=None, max_retries=4,
+                 backoff_base=1.0, backoff_max=30.0, timeouts=None, pool_size=10, cache=None, telemetry=None,
+                 max_retry_after=MAX_RETRY_AFTER):
+        self.base_url = base_url.rstrip('/')
+        # Every attempt, wait and cache lookup is recorded here (see instrumentation.py)
+        self.telemetry = telemetry or Telemetry('transport')
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.network_requests = 0
+        self._count_lock = threading.Lock()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _backoff(self, attempt, retry_after=None):
+        # Full jitter exponential backoff, but never earlier than the server asked for
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def get(self, endpoint, params, extra_headers=None):
+        url = f"{self.base_url}/{endpoint}"
+        timeout = self.timeouts.get(endpoint, FALLBACK_TIMEOUT)
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                with self.telemetry.stage('rate_limit_wait'):
+                    self.rate_limiter.acquire()
+            with self._count_lock:
+                self.network_requests += 1
+
+            retry_after = None
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, params=params, headers=extra_headers, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.telemetry.record_request(endpoint, time.perf_counter() - start, attempt=attempt, error=e)
+                last_error = e
+            else:
+                self.telemetry.record_request(endpoint, time.perf_counter() - start, response.status_code,
+                                              len(response.content), attempt)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response
+                last_error = requests.HTTPError(
+                    f"{response.status_code} from {endpoint}", response=response
+                )
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+            if attempt < self.max_retries:
+                # Retrying before Retry-After is pointless, so a wait past the budget fails now
+                if retry_after is not None and retry_after > self.max_retry_after:
+                    raise StatsRequestError(f"{endpoint}: {last_error}; Retry-After {retry_after:.0f}s exceeds "
+                                            f"the {self.max_retry_after:.0f}s wait budget")
+                delay = self._backoff(attempt, retry_after)
+                print(f"    {endpoint}: {last_error}; retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})")
+                with self.telemetry.stage('retry_backoff'):
+                    time.sleep(delay)
+
+        raise StatsRequestError(f"{endpoint} failed after {self.max_retries + 1} attempts: {last_error}")
+
+    def get_json(self, endpoint, params, revalidate=False):
+        # revalidate: always check with the server (conditionally) even if the entry is fresh
+        if self.cache is None:
+            return self.get(endpoint, params).json()
+
+        with self.telemetry.stage('cache_lookup'):
+            entry = self.cache.get(endpoint, params)
+        if entry is not None and ((entry.fresh and not revalidate) or self.cache.offline):
+            self.telemetry.count(f"cache.{endpoint}.hit")
+            return entry.payload
+        self.telemetry.count(f"cache.{endpoint}.{'miss' if entry is None else 'stale'}")
+        if self.cache.offline:
+            raise CacheMissError(f"{endpoint} {params} is not cached (offline mode)")
+
+        # Stale entry: ask the server whether it changed instead of re-downloading
+        conditional = {}
+        if entry is not None:
+            if entry.etag:
+                conditional['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                conditional['If-Modified-Since'] = entry.last_modified
+
+        response = self.get(endpoint, params, extra_headers=conditional or None)
+        if response.status_code == 304 and entry is not None:
+            self.telemetry.count(f"cache.{endpoint}.not_modified")
+            self.cache.revalidated(entry, params)
+            return entry.payload
+
+        payload = response.json()
+        self.cache.put(endpoint, params, payload,
+                       etag=response.headers.get('ETag'),
+                       last_modified=response.headers.get('Last-Modified'))
+        return payload
+
+    def close(self):
+        self.session.close()